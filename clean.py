@@ -30,7 +30,7 @@ def clean():
     """ remove build artifacts """
     recursively_remove(Project.herringfile_dir, '*.pyc')
     recursively_remove(Project.herringfile_dir, '*~')
-    debug(repr(Project.__dict__))
+    debug(repr(Project.attributes()))
 
     dirs = [Project.dist_dir, Project.egg_dir]
     # print("dirs => %s" % repr(dirs))
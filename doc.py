@@ -683,7 +683,8 @@ with namespace('doc'):
 
 
         def _parse_py_file(py_file):
-            tree = ast.parse(''.join(open(py_file)))
+            with open(py_file, 'rb') as in_file:
+                tree = ast.parse(in_file.read(), filename=py_file)
             # noinspection PyArgumentEqualDefault
             docstring = (ast.get_docstring(tree, clean=True) or '').strip()
             functions = [node.name for node in tree.body if type(node) == ast.FunctionDef]
@@ -75,14 +75,26 @@ Project directories are accessed using a '_dir' suffix.  For example the 'docs'
 with *Project.docs_dir*.
 
 """
+import copy
+import functools
 import os
+import weakref
+
+try:
+    # noinspection PyCompatibility
+    from collections.abc import Mapping
+except ImportError:
+    # noinspection PyUnresolvedReferences
+    from collections import Mapping
 
 # used in requirement conditions
 # noinspection PyUnresolvedReferences
 import re
 import site
+import stat
 
 from pprint import pformat
+from types import MappingProxyType
 
 # noinspection PyUnresolvedReferences
 from herring.herring_app import HerringFile, task
@@ -104,15 +116,101 @@ __author__ = 'wrighroy'
 
 installed_packages = None
 
-site_packages = []
-try:
-    # noinspection PyUnresolvedReferences
-    site_packages = site.getsitepackages()
-except AttributeError:
-    # virtualenv uses site.py from python2.6 instead of python2.7 where getsitepackages() was introduced.
-    pass
+# translation tables used to normalize the project name
+_NAME_STRIP = str.maketrans('', '', ' -')
+_BASE_NORMALIZE = str.maketrans(' -', '__')
+
+_VER_DOT_RE = re.compile(r'[.]')
+
+# the data_dict of the last metadata() call for each ProjectSettings instance
+_LAST_METADATA = weakref.WeakKeyDictionary()
+
+
+@functools.lru_cache(maxsize=None)
+def _base_normalize(value):
+    """
+    Cached conversion of hyphens and spaces to underscores.  Cached by value, so base_name and base_title stay
+    correct when name or title change.
+
+    :param value: a name or title
+    :type value: str
+    :return: the normalized value
+    :rtype: str
+    """
+    return value.translate(_BASE_NORMALIZE)
+
 
+@functools.lru_cache(maxsize=None)
+def _read_design_header(path, mtime):
+    """
+    Read the design header file.  Cached by (path, mtime) so repeated metadata() calls only re-read a changed file.
 
+    :param path: the design header file
+    :type path: str
+    :param mtime: the file's modification time in nanoseconds
+    :type mtime: int
+    :return: the file's contents
+    :rtype: str
+    """
+    with open(path) as in_file:
+        return in_file.read()
+
+
+def _load_design_header(path):
+    """
+    Read the design header file with a single stat to both check the file and get its cache key.
+
+    :param path: the design header file
+    :type path: str
+    :return: the file's contents, or None if path is not a file
+    :rtype: str|None
+    """
+    try:
+        file_stat = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(file_stat.st_mode):
+        return None
+    return _read_design_header(path, file_stat.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_site_packages():
+    """
+    :return: the site packages directories, resolved once per process.
+    :rtype: tuple[str]
+    """
+    try:
+        # noinspection PyUnresolvedReferences
+        return tuple(site.getsitepackages())
+    except AttributeError:
+        # virtualenv uses site.py from python2.6 instead of python2.7 where getsitepackages() was introduced.
+        return ()
+
+
+def _site_packages():
+    """
+    :return: a new list of the site packages directories, so a settings instance can not change another's default.
+    :rtype: list[str]
+    """
+    return list(_get_site_packages())
+
+
+@functools.lru_cache(maxsize=None)
+def _env(name, default_value=None):
+    """
+    Cached env_value() for the ATTRIBUTES defaults, so a variable used by several defaults (ex: USER) is only
+    looked up once.
+
+    :param name: The environment variable name
+    :type name: str
+    :param default_value:  the value to return if the variable is not in the environment
+    :type default_value: str|None
+    """
+    return env_value(name, default_value=default_value)
+
+
+@functools.lru_cache(maxsize=1)
 def get_python_path():
     """
     Handle system specific file location for the python executables.
@@ -126,50 +224,66 @@ def get_python_path():
     return '/usr/bin'
 
 
-ATTRIBUTES = {
-    'animate_logo': {
-        'default': False,
-        'help': 'When creating a logo from the title, create an animated logo (neon blinking)'},
-    'api_dir': {
-        'default': 'docs/api',
-        'help': 'The directory where the API docs are placed relative to the herringfile_dir.  '
-                'Defaults to "{herringfile_dir}/docs/api".'},
-    'author': {
-        'required': True,
-        'help': "The primary author's real name."},
-    'author_email': {
-        'required': True,
-        'help': "The primary author's email address."},
-    'bin_dir': {
-        'default': '~/bin',
-        'help': 'The path to the user\'s bin directory.  '
-                'Defaults to "~/bin".'},
-    'bugzilla_url': {
-        'default': env_value('BUGZILLA_URL', default_value='http://localhost'),
-        'help': 'A URL to bugzilla.'
-                'Defaults to the value of the BUGZILLA_URL environment variable or "http://localhost".'},
-    'build_dir': {
-        'default': 'build',
-        'help': 'The directory to build into relative to the herringfile_dir.  '
-                'Defaults to "{herringfile_dir}/build".'},
-    'changelog_file': {
-        'default': "docs/CHANGES.rst",
-        'help': 'The change log filespec.  '
-                'Defaults to "{herringfile_dir}/docs/CHANGES.rst".'},
-    'class_name_prefix': {
-        'help': 'The prefix to use for class names.  Defaults to the project name.'},
-    'description': {
-        'required': True,
-        'help': 'A short description of this project.'},
-    'deploy_python_version': {
-        'help': 'python version (defined in "python_versions") to deploy to pypi server.  '
-                'Defaults to first version in "python_versions"'},
-    'design_file': {
-        'default': 'docs/design.rst',
-        'help': 'The design documentation file relative to the herringfile_dir.  '
-                'Defaults to "{herringfile_dir}/docs/design.rst".'},
-    'design_header': {
-        'default': """\
+def _prompt_default():
+    """
+    Prompting is allowed unless the task was given kwargs.  Evaluated when prompt is first read, so the task's
+    kwargs have been parsed by then.
+
+    :return: Asserted if interactive prompts are allowed.
+    :rtype: bool
+    """
+    return not task.kwargs
+
+
+def _build_attributes():
+    """
+    :return: the project attribute definitions.  Use ATTRIBUTES instead of calling this directly.
+    :rtype: dict[str,dict]
+    """
+    return {
+        'animate_logo': {
+            'default': False,
+            'help': 'When creating a logo from the title, create an animated logo (neon blinking)'},
+        'api_dir': {
+            'default': 'docs/api',
+            'help': 'The directory where the API docs are placed relative to the herringfile_dir.  '
+                    'Defaults to "{herringfile_dir}/docs/api".'},
+        'author': {
+            'required': True,
+            'help': "The primary author's real name."},
+        'author_email': {
+            'required': True,
+            'help': "The primary author's email address."},
+        'bin_dir': {
+            'default': '~/bin',
+            'help': 'The path to the user\'s bin directory.  '
+                    'Defaults to "~/bin".'},
+        'bugzilla_url': {
+            'default': _env('BUGZILLA_URL', default_value='http://localhost'),
+            'help': 'A URL to bugzilla.'
+                    'Defaults to the value of the BUGZILLA_URL environment variable or "http://localhost".'},
+        'build_dir': {
+            'default': 'build',
+            'help': 'The directory to build into relative to the herringfile_dir.  '
+                    'Defaults to "{herringfile_dir}/build".'},
+        'changelog_file': {
+            'default': "docs/CHANGES.rst",
+            'help': 'The change log filespec.  '
+                    'Defaults to "{herringfile_dir}/docs/CHANGES.rst".'},
+        'class_name_prefix': {
+            'help': 'The prefix to use for class names.  Defaults to the project name.'},
+        'description': {
+            'required': True,
+            'help': 'A short description of this project.'},
+        'deploy_python_version': {
+            'help': 'python version (defined in "python_versions") to deploy to pypi server.  '
+                    'Defaults to first version in "python_versions"'},
+        'design_file': {
+            'default': 'docs/design.rst',
+            'help': 'The design documentation file relative to the herringfile_dir.  '
+                    'Defaults to "{herringfile_dir}/docs/design.rst".'},
+        'design_header': {
+            'default': """\
                 The application is a non-interactive CLI utility.
 
                 A common pattern used is for a class to have an **execute()** method.  The class is initialized,
@@ -177,311 +291,378 @@ ATTRIBUTES = {
                 The instance may then be queried for results before destruction.  I'll refer to this pattern as the
                 execute pattern.
             """,
-        'help': 'A string containing the header for the design_file.  Blank to not use.'},
-    'design_header_file': {
-        'default': None,
-        'help': 'A file containing the header for the design file.  Use None if no file.  Relative to the '
-                'herringfile_dir'},
-    'design_levels': {
-        'default': 1,
-        'help': 'The number of package levels to include in the design file.  Default is "1".'},
-    'dist_dir': {
-        'default': 'dist',
-        'help': 'The directory where the distribution files are placed relative to the herringfile_dir.  '
-                'Defaults to {herringfile_dir}/dist.'},
-    'dist_host': {
-        'default': env_value('LOCAL_PYPI_HOST', default_value='http://localhost'),
-        'help': 'A host name to deploy the distribution files to.  '
-                'Defaults to the value of the LOCAL_PYPI_HOST environment variable or "http://localhost".'},
-    'dist_host_prompt_for_sudo_password': {
-        'default': False,
-        'help': 'prompt for user password to use for sudo commands on the dist_host'},
-    'dist_password': {
-        'default': None,
-        'help': 'The password for logging into the dist_host.  Prompts once on need if not defined.'},
-    'dist_user': {
-        'default': env_value('USER'),
-        'help': 'The user for uploading documentation.  Defaults to the value of the USER environment variable.'},
-    'doc_python_version': {
-        'default': '27',
-        'help': 'python version (defined in "python_versions") to build documentation with.  '
-                'Defaults to "27".'},
-    'docker_applications_dir': {
-        'default': 'applications',
-        'help': 'The directory that contains docker applications relative to the docker_dir.'},
-    'docker_containers_dir': {
-        'default': 'containers',
-        'help': 'The directory that contains docker containers relative to the docker_dir.'},
-    'docker_dir': {
-        'default': 'docker',
-        'help': 'The directory that contains docker files relative to the herringfile_dir.'},
-    'docker_project': {
-        'default': None,
-        'help': 'The first part of a docker tag (project/repo).  Defaults to the package name.'},
-    'docs_dir': {
-        'default': 'docs',
-        'help': 'The documentation directory relative to the herringfile_dir.  '
-                'Defaults to "{herringfile_dir}/docs".'},
-    'docs_group': {
-        'default': 'www-data',
-        'help': 'The web server group that should own the documents when published.  '
-                'Default is "www-data".'},
-    'docs_host': {
-        'help': 'A host name to publish documentation files to.  Defaults to "dist_host"'},
-    'doc_host_prompt_for_sudo_password': {
-        'default': False,
-        'help': 'prompt for doc_user password to use for sudo commands on the doc_host'},
-    'docs_html_dir': {
-        'default': 'build/docs',
-        'help': 'The relative path to the directory to write HTML documentation to.  '
-                'Defaults to "{herringfile_dir}/build/docs".'},
-    'docs_html_path': {
-        'default': None,
-        'help': 'The absolute path to the directory to write HTML documentation to.  '
-                'Defaults to "{herringfile_dir}/{docs_html_dir}".'},
-    'docs_password': {
-        'default': None,
-        'help': 'The password for logging into the docs_host.  Prompts once on need if not defined.'},
-    'docs_path': {
-        'default': env_value('LOCAL_DOCS_PATH', default_value='/var/www/docs'),
-        'help': 'The path on docs_host to place the documentation files.  '
-                'Default is the value of LOCAL_DOCS_PATH environment variable or "/var/www/docs".'},
-    'docs_pdf_dir': {
-        'default': 'build/pdf',
-        'help': 'The directory to write PDF documentation to relative to the herringfile_dir.  '
-                'Defaults to "{herringfile_dir}/build/pdf".'},
-    'docs_slide_dir': {
-        'default': 'build/slides',
-        'help': 'The relative path to the directory to write HTML documentation to.  '
-                'Defaults to "{herringfile_dir}/build/docs".'},
-    'docs_user': {
-        'default': env_value('USER'),
-        'help': 'The web server user that should own the documents when published.  '
-                'Default is "www-data".'},
-    'docs_venv': {
-        'help': 'The virtualenv to use for documentation.  Note that the virtual environment '
-                'name should end in a two digit python version that is in python_versions. '
-                'Default is the virtualenv selected by doc_python_version'},
-    'egg_dir': {
-        'help': 'The project\'s egg filename.  Default is generate from the project\'s "name"'},
-    'enhanced_docs': {
-        'default': False,
-        'help': 'Add diagrams to API documents.  This really slows down document generation.'},
-    'exclude_from_docs': {
-        'default': [],
-        'help': 'These files cause sphinx to barf, so do not include them in the documentation.'},
-    'faq_file': {
-        'default': 'docs/faq.rst',
-        'help': 'The frequently asked question file.  '
-                'Defaults to "{herringfile_dir}/docs/faq.rst".'},
-    'feature_branch': {
-        'default': None,
-        'help': 'The feature branch name.  Default is None.'},
-    'features_dir': {
-        'default': 'features',
-        'help': 'The directory for lettuce features relative to the herringfile_dir.  Defaults to '
-                '"{herringfile_dir}/features".'},
-    'generate_design': {
-        'default': True,
-        'help': 'generate a design document.  '
-                'Defaults to True'},
-    'generate_install': {
-        'default': True,
-        'help': 'generate an install document.  '
-                'Defaults to True'},
-    'generate_readme': {
-        'default': True,
-        'help': "Generate, overwriting if existing, the README.rst from the project's module's docstring"},
-    'generate_usage': {
-        'default': True,
-        'help': 'generate a usage document.  '
-                'Defaults to True'},
-    'github_url': {
-        'default': None,
-        'help': 'The URL for the project on github.  Defaults to None.'},
-    'herring': {
-        'default': 'herring',
-        'help': 'The herring executable to use when invoking a command in a virtualenv.'},
-    'herringfile_dir': {
-        'help': 'The directory where the herringfile is located.'},
-    'install_file': {
-        'default': 'docs/install.rst',
-        'help': 'The installation documentation file relative to the herringfile_dir.  '
-                'Defaults to "{herringfile_dir}/docs/install.rst".'},
-    'installer_dir': {
-        'default': 'installer',
-        'help': 'The directory that contains the bash installer relative to the herringfile_dir.  '
-                'Defaults to "{herringfile_dir}/installer".'},
-    'license_file': {
-        'default': 'docs/license.rst',
-        'help': 'The license documentation file relative to the herringfile_dir.  '
-                'Defaults to "{herringfile_dir}/docs/license.rst".'},
-    'logo_font_size': {
-        'default': 50,
-        'help': 'The point size of the font used when generating a logo.'},
-    'logo_image': {
-        'default': None,
-        'help': 'The project\'s logo image.  The default is generated from the project\'s "name".'},
-    'logo_montage': {
-        'default': True,
-        'help': 'Montage the logo with the project name.'},
-    'logo_name': {
-        'default': None,
-        'help': 'The name used in the generated documentation logo image.  The default is the project\'s "name"'},
-    'main': {
-        'help': 'The source file with the main entry point.'},
-    'metrics_python_versions': {
-        'help': 'python versions (defined in "python_versions") to run metrics with.  '
-                'Defaults to "wheel_python_versions".'},
-    'min_python_version': {
-        'default': '26',
-        'help': 'The minimum version of python required for the application'},
-    'min_python_version_tuple': {
-        'default': (2, 6),
-        'help': 'The minimum version as a tuple of python required for the application'},
-    'name': {
-        'required': True,
-        'help': "The project's name.  Please no hyphens or spaces (they will be removed)."},
-    'news_file': {
-        'default': 'docs/news.rst',
-        'help': 'The news documentation file relative to the herringfile_dir.  '
-                'Defaults to "{herringfile_dir}/docs/news.rst".'},
-    'otto_dir': {
-        'default': os.getenv("OTTO_DIR", None),
-        'help': 'The working directory for the Otto core.'},
-    'package': {
-        'default': None,
-        'required': True,
-        'help': 'The package name relative to the herringfile_dir.  Set to None for document only projects.  Please '
-                'no hyphens or underscores.'},
-    'package_subdirs': {
-        'default': False,
-        'help': 'The "package" directory contains sub-directories that are top level packages '
-                '(package="foo", package_subdirs=True -> "bar.drink").  Normally the "package" directory is the top '
-                'level package (package="foo", package_subdirs=False -> "foo.bar.drink")'},
-    'password': {
-        'default': None,
-        'help': 'The password for logging into the dist_host.  Prompts once on need if not defined.'},
-    'path_to_python': {
-        'default': get_python_path(),
-        'help': 'The path to the python executables to use when making virtual environments.'},
-    'pip_options': {
-        'default': '',
-        'help': 'Command line options to pass to pip install.'},
-    'pip_wheelhouse': {
-        'default': '~/.pip/wheelhouse',
-        'help': 'The path to store python wheels.  "~" is expanded to the current user.  '
-                'Defaults to "~/.pip/wheelhouse".'},
-    'port': {
-        'default': 22,
-        'help': 'The SSH port for transferring files to the dist_host.  '
-                'Defaults to port 22.'},
-    'prompt': {
-        'default': True,
-        'help': 'Allow interactive prompt.  If andy task kwargs are given, then prompt is set to False.  '
-                'Defaults to True.'},
-    'pylintrc': {
-        'default': os.path.join(HerringFile.directory, 'pylint.rc'),
-        'help': 'Full pathspec to the pylintrc file to use.  '
-                'Defaults to "{herringfile_dir}/pylint.rc".'},
-    'pypi_path': {
-        'default': env_value('LOCAL_PYPI_PATH', default_value='/var/pypi/dev'),
-        'help': 'The path on dist_host to place the distribution files.  Defaults to the value of '
-                'the LOCAL_PYPI_PATH environment variable or "/var/pypi/dev".'},
-    'pypiserver': {
-        'help': 'When uploading to a pypyserver, the alias in the ~/.pypirc file to use.'},
-    'python_versions': {
-        'default': ('27', '34'),
-        'help': 'python versions for virtual environments.  Defaults to "(\'27\', \'34\')".'},
-    'pythonPath': {
-        'default': ".:%s" % HerringFile.directory,
-        'help': 'The pythonpath to use.  Defaults to the current directory then "{herringfile_dir}".'},
-    'pythons_str': {
-        'default': "python2.7 python3.4",
-        'help': 'A string listing the python executable names derived from python_versions.'},
-    'quality_dir': {
-        'default': 'quality',
-        'help': 'The directory to place quality reports relative to the herringfile_dir.  '
-                'Defaults to "{herringfile_dir}/quality".'},
-    'readme_file': {
-        'default': "README.rst",
-        'help': 'The README documentation file relative to the herringfile_dir.  '
-                'Defaults to "{herringfile_dir}/README.rst".'},
-    'report_dir': {
-        'default': 'report',
-        'help': 'The directory to place the reports in relative to the herringfile_dir.  '
-                'Defaults to "{herringfile_dir}/report".'},
-    'script': {
-        'help': 'tptqa'},
-    'sdist_python_version': {
-        'help': 'The short python version (ex: 33 means python 3.3) to use to create source distribution.'},
-    'site_packages': {
-        'default': site_packages,
-        'help': "A list of paths to the project's site packages."},
-    'templates_dir': {
-        'default': 'docs/_templates',
-        'help': 'The documentation templates directory relative to "herringfile_dir".  '
-                'Defaults to "{herringfile_dir}/docs/_templates".'},
-    'test_python_versions': {
-        'help': 'python versions (defined in "python_versions") to unit test with.  '
-                'Defaults to "wheel_python_versions".'},
-    'tests_dir': {
-        'default': 'tests',
-        'help': 'The unit tests directory relative to the "herringfile_dir".  '
-                'Defaults to "{herringfile_dir}/tests".'},
-    'title': {
-        'help': 'The human preferred title for the application, defaults to "name".'},
-    'todo_file': {
-        'default': 'docs/todo.rst',
-        'help': 'The TODO documentation file relative to the "herringfile_dir".  '
-                'Defaults to "{herringfile_dir}/docs/todo.rst".'},
-    'tox_python_versions': {
-        'help': 'python versions (defined in "python_versions") for tox to use.  '
-                'Defaults to "test_python_versions".'},
-    'tox_pythons': {
-        'help': 'list of python versions used by tox.'},
-    'uml_dir': {
-        'default': 'docs/_src/uml',
-        'help': 'The directory where documentation UML files are written relative to the "herringfile_dir".  '
-                'Defaults to "{herringfile_dir}/docs/_src/uml".'},
-    'usage_autoprogram': {
-        'default': True,
-        'help': 'Use the sphinx autoprogram extension to document the command line application.'},
-    'usage_file': {
-        'default': 'docs/usage.rst',
-        'help': 'The usage documentation file relative to the "herringfile_dir".  '
-                'Defaults to "{herringfile_dir}/docs/usage.rst".'},
-    'use_templates': {
-        'default': True,
-        'help': 'Allow creation of files from templates.  Set to False for data or documentation only projects.  '
-                'Defaults to True.'},
-    'user': {
-        'default': env_value('USER'),
-        'help': 'The dist_host user.  Defaults to the value of the "USER" environment variable.'},
-    'venv_base': {
-        'default': None,
-        'help': 'The base name for the virtual environments.  Defaults to Settings["package"].'},
-    'version': {
-        'default': '0.0.1',
-        'help': 'The projects current version.'},
-    'versioned_requirements_file_format': {
-        'default': 'requirements.txt',
-        'help': 'When creating multiple virtual environments, the format string for the per'
-                'version requirements.txt file (ex: requirements.txt).'},
-    'virtualenv_requirements': {
-        'default': {
-            'python_versions': ['requirements.txt'],
-            'docs_venv': ['doc.requirements.txt']},
-        'help': 'Specifies which requirements files to use with virtual environments.'},
-    'virtualenvwrapper_script': {
-        'default': env_value(name='VIRTUALENVWRAPPER_SCRIPT',
-                             default_value='/usr/share/virtualenvwrapper/virtualenvwrapper.sh'),
-        'help': 'The absolute path to the virtualenvwrapper script.  '
-                'Defaults to "/usr/share/virtualenvwrapper/virtualenvwrapper.sh".'},
-    'wheel_python_versions': {
-        'help': "A tuple containing short python versions (ex: ('34', '33', '27', '26') ) used to build "
-                "wheel distributions.  Defaults to 'python_versions'"},
-}
+            'help': 'A string containing the header for the design_file.  Blank to not use.'},
+        'design_header_file': {
+            'default': None,
+            'help': 'A file containing the header for the design file.  Use None if no file.  Relative to the '
+                    'herringfile_dir'},
+        'design_levels': {
+            'default': 1,
+            'help': 'The number of package levels to include in the design file.  Default is "1".'},
+        'dist_dir': {
+            'default': 'dist',
+            'help': 'The directory where the distribution files are placed relative to the herringfile_dir.  '
+                    'Defaults to {herringfile_dir}/dist.'},
+        'dist_host': {
+            'default': _env('LOCAL_PYPI_HOST', default_value='http://localhost'),
+            'help': 'A host name to deploy the distribution files to.  '
+                    'Defaults to the value of the LOCAL_PYPI_HOST environment variable or "http://localhost".'},
+        'dist_host_prompt_for_sudo_password': {
+            'default': False,
+            'help': 'prompt for user password to use for sudo commands on the dist_host'},
+        'dist_password': {
+            'default': None,
+            'help': 'The password for logging into the dist_host.  Prompts once on need if not defined.'},
+        'dist_user': {
+            'default': _env('USER'),
+            'help': 'The user for uploading documentation.  Defaults to the value of the USER environment variable.'},
+        'doc_python_version': {
+            'default': '27',
+            'help': 'python version (defined in "python_versions") to build documentation with.  '
+                    'Defaults to "27".'},
+        'docker_applications_dir': {
+            'default': 'applications',
+            'help': 'The directory that contains docker applications relative to the docker_dir.'},
+        'docker_containers_dir': {
+            'default': 'containers',
+            'help': 'The directory that contains docker containers relative to the docker_dir.'},
+        'docker_dir': {
+            'default': 'docker',
+            'help': 'The directory that contains docker files relative to the herringfile_dir.'},
+        'docker_project': {
+            'default': None,
+            'help': 'The first part of a docker tag (project/repo).  Defaults to the package name.'},
+        'docs_dir': {
+            'default': 'docs',
+            'help': 'The documentation directory relative to the herringfile_dir.  '
+                    'Defaults to "{herringfile_dir}/docs".'},
+        'docs_group': {
+            'default': 'www-data',
+            'help': 'The web server group that should own the documents when published.  '
+                    'Default is "www-data".'},
+        'docs_host': {
+            'help': 'A host name to publish documentation files to.  Defaults to "dist_host"'},
+        'doc_host_prompt_for_sudo_password': {
+            'default': False,
+            'help': 'prompt for doc_user password to use for sudo commands on the doc_host'},
+        'docs_html_dir': {
+            'default': 'build/docs',
+            'help': 'The relative path to the directory to write HTML documentation to.  '
+                    'Defaults to "{herringfile_dir}/build/docs".'},
+        'docs_html_path': {
+            'default': None,
+            'help': 'The absolute path to the directory to write HTML documentation to.  '
+                    'Defaults to "{herringfile_dir}/{docs_html_dir}".'},
+        'docs_password': {
+            'default': None,
+            'help': 'The password for logging into the docs_host.  Prompts once on need if not defined.'},
+        'docs_path': {
+            'default': _env('LOCAL_DOCS_PATH', default_value='/var/www/docs'),
+            'help': 'The path on docs_host to place the documentation files.  '
+                    'Default is the value of LOCAL_DOCS_PATH environment variable or "/var/www/docs".'},
+        'docs_pdf_dir': {
+            'default': 'build/pdf',
+            'help': 'The directory to write PDF documentation to relative to the herringfile_dir.  '
+                    'Defaults to "{herringfile_dir}/build/pdf".'},
+        'docs_slide_dir': {
+            'default': 'build/slides',
+            'help': 'The relative path to the directory to write HTML documentation to.  '
+                    'Defaults to "{herringfile_dir}/build/docs".'},
+        'docs_user': {
+            'default': _env('USER'),
+            'help': 'The web server user that should own the documents when published.  '
+                    'Default is "www-data".'},
+        'docs_venv': {
+            'help': 'The virtualenv to use for documentation.  Note that the virtual environment '
+                    'name should end in a two digit python version that is in python_versions. '
+                    'Default is the virtualenv selected by doc_python_version'},
+        'egg_dir': {
+            'help': 'The project\'s egg filename.  Default is generate from the project\'s "name"'},
+        'enhanced_docs': {
+            'default': False,
+            'help': 'Add diagrams to API documents.  This really slows down document generation.'},
+        'exclude_from_docs': {
+            'default': [],
+            'help': 'These files cause sphinx to barf, so do not include them in the documentation.'},
+        'faq_file': {
+            'default': 'docs/faq.rst',
+            'help': 'The frequently asked question file.  '
+                    'Defaults to "{herringfile_dir}/docs/faq.rst".'},
+        'feature_branch': {
+            'default': None,
+            'help': 'The feature branch name.  Default is None.'},
+        'features_dir': {
+            'default': 'features',
+            'help': 'The directory for lettuce features relative to the herringfile_dir.  Defaults to '
+                    '"{herringfile_dir}/features".'},
+        'generate_design': {
+            'default': True,
+            'help': 'generate a design document.  '
+                    'Defaults to True'},
+        'generate_install': {
+            'default': True,
+            'help': 'generate an install document.  '
+                    'Defaults to True'},
+        'generate_readme': {
+            'default': True,
+            'help': "Generate, overwriting if existing, the README.rst from the project's module's docstring"},
+        'generate_usage': {
+            'default': True,
+            'help': 'generate a usage document.  '
+                    'Defaults to True'},
+        'github_url': {
+            'default': None,
+            'help': 'The URL for the project on github.  Defaults to None.'},
+        'herring': {
+            'default': 'herring',
+            'help': 'The herring executable to use when invoking a command in a virtualenv.'},
+        'herringfile_dir': {
+            'help': 'The directory where the herringfile is located.'},
+        'install_file': {
+            'default': 'docs/install.rst',
+            'help': 'The installation documentation file relative to the herringfile_dir.  '
+                    'Defaults to "{herringfile_dir}/docs/install.rst".'},
+        'installer_dir': {
+            'default': 'installer',
+            'help': 'The directory that contains the bash installer relative to the herringfile_dir.  '
+                    'Defaults to "{herringfile_dir}/installer".'},
+        'license_file': {
+            'default': 'docs/license.rst',
+            'help': 'The license documentation file relative to the herringfile_dir.  '
+                    'Defaults to "{herringfile_dir}/docs/license.rst".'},
+        'logo_font_size': {
+            'default': 50,
+            'help': 'The point size of the font used when generating a logo.'},
+        'logo_image': {
+            'default': None,
+            'help': 'The project\'s logo image.  The default is generated from the project\'s "name".'},
+        'logo_montage': {
+            'default': True,
+            'help': 'Montage the logo with the project name.'},
+        'logo_name': {
+            'default': None,
+            'help': 'The name used in the generated documentation logo image.  The default is the project\'s "name"'},
+        'main': {
+            'help': 'The source file with the main entry point.'},
+        'metrics_python_versions': {
+            'help': 'python versions (defined in "python_versions") to run metrics with.  '
+                    'Defaults to "wheel_python_versions".'},
+        'min_python_version': {
+            'default': '26',
+            'help': 'The minimum version of python required for the application'},
+        'min_python_version_tuple': {
+            'default': (2, 6),
+            'help': 'The minimum version as a tuple of python required for the application'},
+        'name': {
+            'required': True,
+            'help': "The project's name.  Please no hyphens or spaces (they will be removed)."},
+        'news_file': {
+            'default': 'docs/news.rst',
+            'help': 'The news documentation file relative to the herringfile_dir.  '
+                    'Defaults to "{herringfile_dir}/docs/news.rst".'},
+        'otto_dir': {
+            'default': _env('OTTO_DIR'),
+            'help': 'The working directory for the Otto core.'},
+        'package': {
+            'default': None,
+            'required': True,
+            'help': 'The package name relative to the herringfile_dir.  Set to None for document only projects.  '
+                    'Please no hyphens or underscores.'},
+        'package_subdirs': {
+            'default': False,
+            'help': 'The "package" directory contains sub-directories that are top level packages '
+                    '(package="foo", package_subdirs=True -> "bar.drink").  Normally the "package" directory is the '
+                    'top level package (package="foo", package_subdirs=False -> "foo.bar.drink")'},
+        'password': {
+            'default': None,
+            'help': 'The password for logging into the dist_host.  Prompts once on need if not defined.'},
+        'path_to_python': {
+            'default_factory': get_python_path,
+            'help': 'The path to the python executables to use when making virtual environments.'},
+        'pip_options': {
+            'default': '',
+            'help': 'Command line options to pass to pip install.'},
+        'pip_wheelhouse': {
+            'default': '~/.pip/wheelhouse',
+            'help': 'The path to store python wheels.  "~" is expanded to the current user.  '
+                    'Defaults to "~/.pip/wheelhouse".'},
+        'port': {
+            'default': 22,
+            'help': 'The SSH port for transferring files to the dist_host.  '
+                    'Defaults to port 22.'},
+        'prompt': {
+            'default_factory': _prompt_default,
+            'help': 'Allow interactive prompt.  If andy task kwargs are given, then prompt is set to False.  '
+                    'Defaults to True.'},
+        'pylintrc': {
+            'default': os.path.join(HerringFile.directory, 'pylint.rc'),
+            'help': 'Full pathspec to the pylintrc file to use.  '
+                    'Defaults to "{herringfile_dir}/pylint.rc".'},
+        'pypi_path': {
+            'default': _env('LOCAL_PYPI_PATH', default_value='/var/pypi/dev'),
+            'help': 'The path on dist_host to place the distribution files.  Defaults to the value of '
+                    'the LOCAL_PYPI_PATH environment variable or "/var/pypi/dev".'},
+        'pypiserver': {
+            'help': 'When uploading to a pypyserver, the alias in the ~/.pypirc file to use.'},
+        'python_versions': {
+            'default': ('27', '34'),
+            'help': 'python versions for virtual environments.  Defaults to "(\'27\', \'34\')".'},
+        'pythonPath': {
+            'default': ".:%s" % HerringFile.directory,
+            'help': 'The pythonpath to use.  Defaults to the current directory then "{herringfile_dir}".'},
+        'pythons_str': {
+            'default': "python2.7 python3.4",
+            'help': 'A string listing the python executable names derived from python_versions.'},
+        'quality_dir': {
+            'default': 'quality',
+            'help': 'The directory to place quality reports relative to the herringfile_dir.  '
+                    'Defaults to "{herringfile_dir}/quality".'},
+        'readme_file': {
+            'default': "README.rst",
+            'help': 'The README documentation file relative to the herringfile_dir.  '
+                    'Defaults to "{herringfile_dir}/README.rst".'},
+        'report_dir': {
+            'default': 'report',
+            'help': 'The directory to place the reports in relative to the herringfile_dir.  '
+                    'Defaults to "{herringfile_dir}/report".'},
+        'script': {
+            'help': 'tptqa'},
+        'sdist_python_version': {
+            'help': 'The short python version (ex: 33 means python 3.3) to use to create source distribution.'},
+        'site_packages': {
+            'default_factory': _site_packages,
+            'help': "A list of paths to the project's site packages."},
+        'templates_dir': {
+            'default': 'docs/_templates',
+            'help': 'The documentation templates directory relative to "herringfile_dir".  '
+                    'Defaults to "{herringfile_dir}/docs/_templates".'},
+        'test_python_versions': {
+            'help': 'python versions (defined in "python_versions") to unit test with.  '
+                    'Defaults to "wheel_python_versions".'},
+        'tests_dir': {
+            'default': 'tests',
+            'help': 'The unit tests directory relative to the "herringfile_dir".  '
+                    'Defaults to "{herringfile_dir}/tests".'},
+        'title': {
+            'help': 'The human preferred title for the application, defaults to "name".'},
+        'todo_file': {
+            'default': 'docs/todo.rst',
+            'help': 'The TODO documentation file relative to the "herringfile_dir".  '
+                    'Defaults to "{herringfile_dir}/docs/todo.rst".'},
+        'tox_python_versions': {
+            'help': 'python versions (defined in "python_versions") for tox to use.  '
+                    'Defaults to "test_python_versions".'},
+        'tox_pythons': {
+            'help': 'list of python versions used by tox.'},
+        'uml_dir': {
+            'default': 'docs/_src/uml',
+            'help': 'The directory where documentation UML files are written relative to the "herringfile_dir".  '
+                    'Defaults to "{herringfile_dir}/docs/_src/uml".'},
+        'usage_autoprogram': {
+            'default': True,
+            'help': 'Use the sphinx autoprogram extension to document the command line application.'},
+        'usage_file': {
+            'default': 'docs/usage.rst',
+            'help': 'The usage documentation file relative to the "herringfile_dir".  '
+                    'Defaults to "{herringfile_dir}/docs/usage.rst".'},
+        'use_templates': {
+            'default': True,
+            'help': 'Allow creation of files from templates.  Set to False for data or documentation only projects.  '
+                    'Defaults to True.'},
+        'user': {
+            'default': _env('USER'),
+            'help': 'The dist_host user.  Defaults to the value of the "USER" environment variable.'},
+        'venv_base': {
+            'default': None,
+            'help': 'The base name for the virtual environments.  Defaults to Settings["package"].'},
+        'version': {
+            'default': '0.0.1',
+            'help': 'The projects current version.'},
+        'versioned_requirements_file_format': {
+            'default': 'requirements.txt',
+            'help': 'When creating multiple virtual environments, the format string for the per'
+                    'version requirements.txt file (ex: requirements.txt).'},
+        'virtualenv_requirements': {
+            'default': {
+                'python_versions': ['requirements.txt'],
+                'docs_venv': ['doc.requirements.txt']},
+            'help': 'Specifies which requirements files to use with virtual environments.'},
+        'virtualenvwrapper_script': {
+            'default': _env('VIRTUALENVWRAPPER_SCRIPT',
+                            default_value='/usr/share/virtualenvwrapper/virtualenvwrapper.sh'),
+            'help': 'The absolute path to the virtualenvwrapper script.  '
+                    'Defaults to "/usr/share/virtualenvwrapper/virtualenvwrapper.sh".'},
+        'wheel_python_versions': {
+            'help': "A tuple containing short python versions (ex: ('34', '33', '27', '26') ) used to build "
+                    "wheel distributions.  Defaults to 'python_versions'"},
+    }
+
+
+def _has_default(attrs):
+    """
+    :param attrs: an ATTRIBUTES value
+    :type attrs: dict
+    :return: Asserted if the attribute has a 'default' value or a 'default_factory' to compute it.
+    :rtype: bool
+    """
+    return 'default' in attrs or 'default_factory' in attrs
+
+
+def _default_value(attrs):
+    """
+    :param attrs: an ATTRIBUTES value
+    :type attrs: dict
+    :return: the attribute's default, calling its 'default_factory' if it has one, else None.
+    """
+    if 'default_factory' in attrs:
+        return attrs['default_factory']()
+    return attrs.get('default')
+
+
+class _LazyDict(Mapping):
+    """
+    Read-only mapping that calls the factory to build the underlying dictionary on first access.  The keys are
+    interned and each value is wrapped in a read-only view so the registry cannot be changed through it.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._dict = None
+
+    def _materialize(self):
+        if self._dict is None:
+            self._dict = dict((sys.intern(key), MappingProxyType(value)) for key, value in self._factory().items())
+        return self._dict
+
+    def __getitem__(self, key):
+        return self._materialize()[key]
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __len__(self):
+        return len(self._materialize())
+
+
+ATTRIBUTES = _LazyDict(_build_attributes)
+
+
+@functools.lru_cache(maxsize=1)
+def _required_keys():
+    """
+    :return: the sorted names of the required attributes that have no default, so must be given by the herringfile.
+    :rtype: tuple
+    """
+    return tuple(sorted(key for key, attrs in ATTRIBUTES.items() if attrs.get('required') and not _has_default(attrs)))
+
+
+@functools.lru_cache(maxsize=1)
+def _defaulted_items():
+    """
+    :return: the (name, ATTRIBUTES value) pairs of the attributes that have a default.
+    :rtype: tuple
+    """
+    return tuple((key, attrs) for key, attrs in ATTRIBUTES.items() if _has_default(attrs))
 
 
 # noinspection PyMethodMayBeStatic,PyArgumentEqualDefault
@@ -492,26 +673,37 @@ class ProjectSettings(object):
     @DynamicAttrs
     """
 
-    def __init__(self):
-        for key in ATTRIBUTES.keys():
-            attrs = ATTRIBUTES[key]
-            if 'default' in attrs:
-                self.__setattr__(key, attrs['default'])
-        setattr(self, 'prompt', not task.kwargs)
+    # directories already created by __directory during this process
+    _dir_cache = set()
+
+    def __getattr__(self, name):
+        # only called when the attribute has not been set, so fall back to the ATTRIBUTES default
+        attrs = ATTRIBUTES.get(name)
+        if attrs is None or not _has_default(attrs):
+            raise AttributeError("'{cls}' object has no attribute '{name}'".format(cls=type(self).__name__,
+                                                                                   name=name))
+        value = _default_value(attrs)
+        self.__dict__[name] = value
+        return value
 
     def __str__(self):
-        return pformat(self.__dict__)
-
-    # def attributes(self):
-    #     """
-    #     :return: the attributes in a dictionary
-    #     :rtype: dict
-    #     """
-    #     attrs = {}
-    #     for name in ATTRIBUTES.keys():
-    #         value = getattr(self, name, None)
-    #         attrs[name] = value
-    #     return attrs
+        return "<{cls} name={name!r}>".format(cls=type(self).__name__, name=self.__dict__.get('name'))
+
+    def dump(self):
+        """
+        :return: all of the attributes pretty printed
+        :rtype: str
+        """
+        return pformat(self.attributes())
+
+    def attributes(self):
+        """
+        :return: the attributes, including any defaults that have not been explicitly set, in a dictionary
+        :rtype: dict
+        """
+        attrs = dict((key, _default_value(value)) for key, value in _defaulted_items())
+        attrs.update(self.__dict__)
+        return attrs
 
     def metadata(self, data_dict):
         """
@@ -521,49 +713,68 @@ class ProjectSettings(object):
         :type data_dict: dict
         """
 
+        if _LAST_METADATA.get(self) == data_dict:
+            # same attributes as the last call, so the derived attributes are already set
+            return
+        _LAST_METADATA[self] = copy.deepcopy(data_dict)
+
+        values = self.__dict__
+
+        def get(attr):
+            """
+            Get the attribute's value without going through attribute lookup, falling back to the attribute's
+            default, or None if neither is set.
+            """
+            if attr in values:
+                return values[attr]
+            return _default_value(ATTRIBUTES.get(attr, {}))
+
         def set_default_attr(attr, default_attr, first=False):
             """
             If the attribute is not set, then set it to the value of the default attribute.
             If first is asserted, then the value of the default attribute should be a list and we
             want the first value in the list.
             """
-            if getattr(self, attr, None) is None:
-                default_value = getattr(self, default_attr, None)
+            if get(attr) is None:
+                default_value = get(default_attr)
                 if default_value and first:
-                    default_value = getattr(self, default_attr, None)[0]
-                setattr(self, attr, default_value)
+                    default_value = default_value[0]
+                values[attr] = default_value
 
         # print("metadata(%s)" % repr(data_dict))
+        values.update(data_dict)
         for key, value in data_dict.items():
-            self.__setattr__(key, value)
             if key.endswith('_dir'):
                 self.__directory(value)
 
         self.__check_missing_required_attributes()
 
-        setattr(self, 'name', re.sub(r'[ -]', '', getattr(self, 'name', '')))
+        values['name'] = values.get('name', '').translate(_NAME_STRIP)
         set_default_attr('title', 'name')
         set_default_attr('class_name_prefix', 'name')
 
         # noinspection PyUnresolvedReferences
         from herringlib.version import get_project_version
 
-        self.__setattr__('version', get_project_version(project_package=self.package))
-        debug("{name} version: {version}".format(name=getattr(self, 'name', ''), version=self.version))
+        name = values['name']
+        package = get('package')
+
+        values['version'] = get_project_version(project_package=package)
+        debug("{name} version: {version}".format(name=name, version=values['version']))
 
-        if Project.package is None:
-            Project.main = None
+        if package is None:
+            values['main'] = None
         else:
-            if 'script' not in self.__dict__:
-                self.__setattr__('script', Project.package)
-            if 'main' not in self.__dict__:
-                self.__setattr__('main', '{name}_main.py'.format(name=Project.package))
+            if 'script' not in values:
+                values['script'] = package
+            if 'main' not in values:
+                values['main'] = '{name}_main.py'.format(name=package)
 
-        if Project.name is not None:
-            if Project.logo_name is None:
-                Project.logo_name = Project.name
-            if 'egg_dir' not in self.__dict__:
-                self.__setattr__('egg_dir', "{name}.egg-info".format(name=Project.name))
+        if name is not None:
+            if get('logo_name') is None:
+                values['logo_name'] = name
+            if 'egg_dir' not in values:
+                values['egg_dir'] = "{name}.egg-info".format(name=name)
 
         set_default_attr('venv_base', 'package')
         set_default_attr('test_python_versions', 'python_versions')
@@ -574,20 +785,18 @@ class ProjectSettings(object):
         set_default_attr('sdist_python_version', 'python_versions', first=True)
         set_default_attr('deploy_python_version', 'python_versions', first=True)
 
-        setattr(self, 'min_python_version_tuple', self.version_to_tuple(getattr(self, 'min_python_version', '26')))
+        values['min_python_version_tuple'] = self.version_to_tuple(get('min_python_version'))
 
-        setattr(self, 'pythons_str', " ".join(list(["python{v}".format(v=self.ver_to_version(v))
-                                                    for v in getattr(self, 'python_versions')])))
+        values['pythons_str'] = " ".join("python{v}".format(v=self.ver_to_version(v))
+                                         for v in get('python_versions'))
 
-        setattr(self, 'tox_pythons', ",".join(['py{v}'.format(v=v) for v in getattr(self, 'tox_python_versions')]))
+        values['tox_pythons'] = ",".join('py{v}'.format(v=v) for v in get('tox_python_versions'))
 
-        if getattr(self, 'docs_venv', None) is None:
-            setattr(self, 'docs_venv', '{name}{ver}'.format(name=getattr(self, 'venv_base'),
-                                                            ver=getattr(self, 'doc_python_version')))
+        if get('docs_venv') is None:
+            values['docs_venv'] = '{name}{ver}'.format(name=get('venv_base'), ver=get('doc_python_version'))
 
-        if getattr(self, 'docs_html_path', None) is None:
-            setattr(self, 'docs_html_path', os.path.join(getattr(self, 'herringfile_dir', None),
-                                                         getattr(self, 'docs_html_dir', None)))
+        if get('docs_html_path') is None:
+            values['docs_html_path'] = os.path.join(get('herringfile_dir'), get('docs_html_dir'))
 
         set_default_attr('docs_host', 'dist_host')
         set_default_attr('docs_user', 'dist_user')
@@ -595,13 +804,15 @@ class ProjectSettings(object):
         set_default_attr('docker_project', 'package')
 
         # load design header from file if available
-        # noinspection PyBroadException
-        try:
-            with open(self.design_header_file) as in_file:
-                # noinspection PyAttributeOutsideInit
-                self.design_header = in_file.read()
-        except Exception:
-            pass
+        design_header_file = get('design_header_file')
+        if design_header_file:
+            try:
+                design_header = _load_design_header(design_header_file)
+                if design_header is not None:
+                    values['design_header'] = design_header
+            except OSError as ex:
+                warning("Unable to read design_header_file {file}: {err}".format(file=design_header_file,
+                                                                                 err=str(ex)))
 
         # info(str(self))
 
@@ -613,14 +824,7 @@ class ProjectSettings(object):
             raise Exception('The herringfiles has missing required keys.  Please correct and try again.')
 
     def __missing_required_attributes(self):
-        missing_keys = []
-        for key in sorted(ATTRIBUTES.keys()):
-            attrs = ATTRIBUTES[key]
-            if 'required' in attrs:
-                if attrs['required']:
-                    if key not in self.__dict__:
-                        missing_keys.append(key)
-        return missing_keys
+        return [key for key in _required_keys() if key not in self.__dict__]
 
     def __directory(self, relative_name):
         """return the full path from the given path relative to the herringfile directory"""
@@ -630,7 +834,11 @@ class ProjectSettings(object):
             directory_name = os.path.abspath(relative_name)
         else:
             directory_name = os.path.join(self.herringfile_dir, relative_name)
-        return mkdir_p(directory_name)
+        if directory_name in self._dir_cache:
+            return directory_name
+        mkdir_p(directory_name)
+        self._dir_cache.add(directory_name)
+        return directory_name
 
     def env_without_virtualenvwrapper(self):
         """
@@ -641,16 +849,11 @@ class ProjectSettings(object):
         :rtype: dict
         """
         hook_dir = env_value('VIRTUALENVWRAPPER_HOOK_DIR', None)
-        new_parts = []
-        for part in os.environ['PATH'].split(':'):
-            if hook_dir is not None and hook_dir in part:
-                continue
-            new_parts.append(str(part))
-        new_path = ':'.join(new_parts)
-        new_env = os.environ.copy()
-        if 'VIRTUAL_ENV' in new_env:
-            del new_env['VIRTUAL_ENV']
-        new_env['PATH'] = new_path
+        parts = os.environ['PATH'].split(':')
+        if hook_dir:
+            parts = [part for part in parts if hook_dir not in part]
+        new_env = dict(os.environ, PATH=':'.join(parts))
+        new_env.pop('VIRTUAL_ENV', None)
         return new_env
 
     @property
@@ -659,7 +862,7 @@ class ProjectSettings(object):
         :returns: the normalized name attribute (hyphens and spaces converted to underscores).
         :rtype: str
         """
-        return self.name.replace(' ', '_').replace('-', '_')
+        return _base_normalize(self.name)
 
     @property
     def base_title(self):
@@ -667,7 +870,7 @@ class ProjectSettings(object):
         :returns: the normalized name attribute (hyphens and spaces converted to underscores).
         :rtype: str
         """
-        return self.title.replace(' ', '_').replace('-', '_')
+        return _base_normalize(self.title)
 
     def required_files(self):
         """
@@ -675,7 +878,9 @@ class ProjectSettings(object):
         """
         return Requirements(self).required_files()
 
-    def ver_to_version(self, ver):
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def ver_to_version(ver):
         """
         Convert shorthand version (ex: 27) to full dotted notation (ex: 2.7).
 
@@ -686,7 +891,9 @@ class ProjectSettings(object):
         """
         return '.'.join(list(ver))
 
-    def ver_to_tuple(self, ver):
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def ver_to_tuple(ver):
         """
         Convert shorthand version (ex: 27" to version tuple (ex: (2, 7)).
 
@@ -697,7 +904,9 @@ class ProjectSettings(object):
         """
         return tuple(list(ver))
 
-    def version_to_ver(self, version):
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def version_to_ver(version):
         """
         Convert full dotted notation (ex: 2.7) to shorthand version (ex: 27)
 
@@ -706,9 +915,11 @@ class ProjectSettings(object):
         :return: shorthand version
         :rtype: str
         """
-        return re.sub('[.]', '', version)
+        return _VER_DOT_RE.sub('', version)
 
-    def version_to_tuple(self, version):
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def version_to_tuple(version):
         """
         Convert full dotted notation (ex: 2.7) to version tuple (ex: (2, 7))
 
@@ -717,7 +928,7 @@ class ProjectSettings(object):
         :return: tuple version
         :rtype: tuple
         """
-        return self.ver_to_tuple(self.version_to_ver(version))
+        return ProjectSettings.ver_to_tuple(ProjectSettings.version_to_ver(version))
 
     def configured(self):
         """
@@ -5,13 +5,27 @@ Project tasks
 Add the following to your *requirements.txt* file:
 
 * docutils!=0.14rc1; python_version == "[python_versions]"
+* importlib_metadata; python_version < "3.8"
 
 """
 import ast
+import functools
+import importlib
+import json
 import os
 from pprint import pformat
-import shutil
+import re
+import stat
+import sys
 import textwrap
+
+try:
+    # noinspection PyUnresolvedReferences,PyCompatibility
+    from importlib.metadata import distributions
+except ImportError:
+    # noinspection PyUnresolvedReferences
+    from importlib_metadata import distributions
+
 # noinspection PyUnresolvedReferences
 from herringlib.prompt import prompt
 # noinspection PyUnresolvedReferences
@@ -19,15 +33,6 @@ from herringlib.template import Template
 # noinspection PyUnresolvedReferences
 from herringlib.venv import VirtualenvInfo
 
-try:
-    # python3
-    # noinspection PyUnresolvedReferences,PyCompatibility
-    from configparser import ConfigParser, NoSectionError
-except ImportError:
-    # python2
-    # noinspection PyUnresolvedReferences,PyCompatibility
-    from ConfigParser import ConfigParser, NoSectionError
-
 # noinspection PyUnresolvedReferences
 from herring.herring_app import task, HerringFile
 
@@ -36,12 +41,171 @@ from herringlib.simple_logger import info, debug
 # noinspection PyUnresolvedReferences
 from herringlib.local_shell import LocalShell
 # noinspection PyUnresolvedReferences
+from herringlib.mkdir_p import mkdir_p
+# noinspection PyUnresolvedReferences
 from herringlib.requirements import Requirements, Requirement
 # noinspection PyUnresolvedReferences
 from herringlib.project_settings import Project, ATTRIBUTES
 
 missing_modules = []
 
+# site-packages directory of each virtualenv found by environment() keyed by _venv_python_key()
+_VENV_SITE_PACKAGES = {}
+
+# import results of the packages_required() checks keyed by the lower case package name
+_CHECKED = {}
+
+# _project_defaults() results keyed by the state of their inputs
+_DEFAULTS_CACHE = {}
+
+# python < 3.8 parses string literals as ast.Str, python < 3.6 does not have ast.Constant,
+# and newer pythons drop ast.Str
+_AST_STR = getattr(ast, 'Str', None)
+_AST_CONSTANT = getattr(ast, 'Constant', None)
+
+_SECTION_REGEX = re.compile(r'^\[(?P<section>[^\]]+)\]\s*$')
+_KEY_VALUE_REGEX = re.compile(r'^(?P<key>[^=:\s][^=:]*?)\s*[=:]\s*(?P<value>.*)$')
+_INTERPOLATION_REGEX = re.compile(r'%(?:\((?P<name>[^)]+)\)s|%)')
+
+# same limit as ConfigParser's MAX_INTERPOLATION_DEPTH
+_MAX_INTERPOLATION_DEPTH = 10
+
+
+def _read_config_files(config_files):
+    """
+    Minimal INI reader for the flat key = value sections used by herring config files.
+
+    Like ConfigParser: missing files are ignored, keys are lower cased, comment lines (starting with '#' or ';')
+    are skipped, indented lines continue the previous value, [DEFAULT] keys are merged into every section,
+    and values are interpolated, '%(name)s' by the named key of the same section and '%%' by '%'.
+    Unlike ConfigParser, a reference to a missing key is left as is instead of raising an error.
+
+    The parsed result is cached until one of the files changes, so treat it as read only.
+
+    :param config_files: the config file names
+    :type config_files: list[str]
+    :return: dictionary with section name as the key and the section's key/value dictionary as the value
+    :rtype: dict[str,dict[str,str]]
+    """
+    config_files = tuple(config_files)
+    return _parse_config_files(config_files, _mtimes(config_files))
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_files(config_files, mtimes):
+    """
+    :param config_files: the config file names
+    :type config_files: tuple[str]
+    :param mtimes: the (file name, modification time) of the existing config files, used as the cache key
+    :type mtimes: tuple
+    :return: dictionary with section name as the key and the section's key/value dictionary as the value
+    :rtype: dict[str,dict[str,str]]
+    """
+    sections = {}
+    for config_file in config_files:
+        try:
+            with open(config_file) as in_file:
+                section = None
+                key = None
+                for line in in_file:
+                    if not line.strip() or line.lstrip()[0] in '#;':
+                        continue
+                    if line[0].isspace():
+                        if section is not None and key is not None:
+                            section[key] = (section[key] + '\n' + line.strip()).strip()
+                        continue
+                    line = line.strip()
+                    match = _SECTION_REGEX.match(line)
+                    if match:
+                        section = sections.setdefault(match.group('section'), {})
+                        key = None
+                        continue
+                    match = _KEY_VALUE_REGEX.match(line)
+                    if match and section is not None:
+                        key = match.group('key').lower()
+                        section[key] = match.group('value').strip()
+        except IOError:
+            pass
+    defaults = sections.pop('DEFAULT', {})
+    result = {}
+    for name, section in sections.items():
+        raw = dict(defaults)
+        raw.update(section)
+        result[name] = dict((key, _interpolate(value, raw)) for key, value in raw.items())
+    return result
+
+
+def _interpolate(value, raw, depth=0):
+    """
+    Replace the '%(name)s' references in value with the interpolated raw[name] and '%%' with '%'.
+
+    :param value: the raw value
+    :type value: str
+    :param raw: the section's raw values keyed by the lower case key
+    :type raw: dict[str,str]
+    :param depth: the current reference nesting depth
+    :type depth: int
+    :return: the interpolated value
+    :rtype: str
+    """
+    def _replace(match):
+        name = match.group('name')
+        if name is None:
+            return '%'
+        name = name.lower()
+        if name not in raw or depth >= _MAX_INTERPOLATION_DEPTH:
+            return match.group(0)
+        return _interpolate(raw[name], raw, depth + 1)
+
+    return _INTERPOLATION_REGEX.sub(_replace, value)
+
+
+@functools.lru_cache(maxsize=4)
+def _setup_py_kwargs(setup_py, mtime):
+    """
+    Use AST to find the keyword arguments with string values in the first setup() call in setup.py.
+    Cached by (setup_py, mtime) so setup.py is parsed once until it changes.
+
+    :param setup_py: path to setup.py
+    :type setup_py: str
+    :param mtime: modification time of setup.py in nanoseconds
+    :type mtime: int
+    :returns: the keyword argument values keyed by the keyword name
+    :rtype: dict
+    """
+    with open(setup_py, 'rb') as in_file:
+        tree = ast.parse(in_file.read(), filename=setup_py)
+    # scan setup.py for the first call to 'setup'.
+    for node in tree.body:
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Call):
+            func = node.value.func
+            if getattr(func, 'id', None) == 'setup' or getattr(getattr(func, 'value', None), 'id', None) == 'setup':
+                kwargs = {}
+                for keyword_arg in node.value.keywords:
+                    value = _string_value(keyword_arg.value)
+                    if value is not None:
+                        kwargs[keyword_arg.arg] = value
+                return kwargs
+    return {}
+
+
+def _string_value(node):
+    """
+    :param node: an AST expression node
+    :type node: ast.AST
+    :return: the node's value if it is a string literal, else None
+    :rtype: str|None
+    """
+    if _AST_CONSTANT is not None and isinstance(node, _AST_CONSTANT):
+        value = node.value
+    elif _AST_STR is not None and isinstance(node, _AST_STR):
+        value = node.s
+    else:
+        return None
+    if isinstance(value, str):
+        return value
+    return None
+
 
 def value_from_setup_py(arg_name):
     """
@@ -53,34 +217,39 @@ def value_from_setup_py(arg_name):
     :returns: the name value or None
     :rtype: str|None
     """
+    return _load_setup_kwargs().get(arg_name)
+
+
+def _load_setup_kwargs():
+    """
+    :return: the string keyword arguments of the setup() call in setup.py in the current directory, or an empty
+             dictionary if there is not a setup.py.  Treat as read only, it is cached.
+    :rtype: dict
+    """
     setup_py = 'setup.py'
-    if os.path.isfile(setup_py):
-        # scan setup.py for a call to 'setup'.
-        tree = ast.parse(''.join(open(setup_py)))
-        call_nodes = [node.value for node in tree.body if type(node) == ast.Expr and type(node.value) == ast.Call]
-
-        # noinspection PyShadowingNames
-        def is_setup(call_node):
-            try:
-                return call_node.func.id == 'setup'
-            except AttributeError as ex:
-                try:
-                    return call_node.func.value.id == 'setup'
-                except AttributeError as ex:
-                    print(str(ex))
-                    print(ast.dump(call_node.func))
-                    print(ast.dump(call_node))
-
-        keywords = [call_node.keywords for call_node in call_nodes if is_setup(call_node)]
-        # now setup() takes keyword arguments so scan them looking for key that matches the given arg_name,
-        # then return the keyword's value
-        for keyword in keywords:
-            for keyword_arg in keyword:
-                if keyword_arg.arg == arg_name:
-                    if hasattr(keyword_arg.value, 's'):
-                        return keyword_arg.value.s
-    # didn't find it
-    return None
+    try:
+        mtime = os.stat(setup_py).st_mtime_ns
+    except OSError:
+        return {}
+    return _setup_py_kwargs(os.path.abspath(setup_py), mtime)
+
+
+def _mtimes(file_names):
+    """
+    :param file_names: the files to check
+    :type file_names: list[str]
+    :return: the (file name, modification time in nanoseconds) of each of the files that exist
+    :rtype: tuple
+    """
+    mtimes = []
+    for file_name in file_names:
+        try:
+            file_stat = os.stat(file_name)
+        except OSError:
+            continue
+        if stat.S_ISREG(file_stat.st_mode):
+            mtimes.append((file_name, file_stat.st_mtime_ns))
+    return tuple(mtimes)
 
 
 def _project_defaults():
@@ -96,60 +265,67 @@ def _project_defaults():
     :return: dictionary of defaults
     :rtype: dict[str,str]
     """
+    settings = HerringFile.settings
+    cwd = os.path.abspath(os.curdir)
+    cache_key = (cwd,
+                 os.environ.get('USER'),
+                 None if settings is None else _mtimes(settings.config_files),
+                 _mtimes(['setup.py']),
+                 repr(sorted(task.kwargs.items())))
+    if cache_key in _DEFAULTS_CACHE:
+        return _DEFAULTS_CACHE[cache_key].copy()
+
+    base_name = os.path.basename(cwd)
+    title = base_name.capitalize()
     defaults = {
-        'package': os.path.basename(os.path.abspath(os.curdir)),
-        'name': os.path.basename(os.path.abspath(os.curdir)).capitalize(),
+        'package': base_name,
+        'name': title,
         'description': 'The greatest project there ever was or will be!',
         'author': 'author',
-        'title': os.path.basename(os.path.abspath(os.curdir)).capitalize(),
+        'title': title,
     }
     if 'USER' in os.environ:
         defaults['author'] = os.environ['USER']
     defaults['author_email'] = '{author}@example.com'.format(author=defaults['author'])
 
-    # override defaults from herringfile
-    # for key in ['name', 'author', 'author_email', 'description']:
-    # attributes = Project.attributes()
-    # for key in [key for key in attributes.keys() if attributes[key] is not None]:
-    #     # noinspection PyBroadException
-    #     try:
-    #         value = getattr(Project, key, None)
-    #         if value is not None:
-    #             defaults[key] = value
-    #     except:
-    #         pass
-
     # override defaults from any config files
-    settings = HerringFile.settings
     if settings is not None:
-        config = ConfigParser()
-        config.read(settings.config_files)
+        config = _read_config_files(settings.config_files)
         for section in ['project']:
-            try:
-                defaults.update(dict(config.items(section)))
-            except NoSectionError:
-                pass
+            defaults.update(config.get(section, {}))
 
     # override defaults from kwargs
-    for key in task.kwargs:
-        defaults[key] = task.kwargs[key]
+    defaults.update(task.kwargs)
 
     # override defaults from setup.py
-    for key in ['name', 'author', 'author_email', 'description']:
-        value = value_from_setup_py(key)
-        if value is not None:
-            defaults[key] = value
+    setup_kwargs = _load_setup_kwargs()
+    defaults.update((key, setup_kwargs[key]) for key in ('name', 'author', 'author_email', 'description')
+                    if key in setup_kwargs)
 
     # now add any attributes that are not already in defaults
+    attributes = Project.attributes()
     for key in ATTRIBUTES:
         if key not in defaults:
-            value = getattr(Project, key, None)
+            value = attributes.get(key)
             if value is not None:
                 defaults[key] = value
             else:
                 print("{key}:None".format(key=key))
 
-    return defaults
+    _DEFAULTS_CACHE[cache_key] = defaults
+    return defaults.copy()
+
+
+@functools.lru_cache(maxsize=4)
+def _template_dirs(herringlib_paths):
+    """
+    :param herringlib_paths: the herringlib directories
+    :type herringlib_paths: tuple[str]
+    :return: the absolute template directory of each herringlib directory
+    :rtype: tuple[str]
+    """
+    return tuple(os.path.abspath(os.path.join(herringlib, 'herringlib', 'templates'))
+                 for herringlib in herringlib_paths)
 
 
 @task(namespace='project', help='Available options: --name, --package, --author, --author_email, --description',
@@ -173,8 +349,7 @@ def init():
 
         template = Template()
 
-        for template_dir in [os.path.abspath(os.path.join(herringlib, 'herringlib', 'templates'))
-                             for herringlib in HerringFile.herringlib_paths]:
+        for template_dir in _template_dirs(tuple(HerringFile.herringlib_paths)):
 
             info("template directory: %s" % template_dir)
             # noinspection PyArgumentEqualDefault
@@ -192,8 +367,7 @@ def update():
 
         template = Template()
 
-        for template_dir in [os.path.abspath(os.path.join(herringlib, 'herringlib', 'templates'))
-                             for herringlib in HerringFile.herringlib_paths]:
+        for template_dir in _template_dirs(tuple(HerringFile.herringlib_paths)):
 
             info("template directory: %s" % template_dir)
             # noinspection PyArgumentEqualDefault
@@ -203,64 +377,105 @@ def update():
 @task(namespace='project', configured='optional')
 def show():
     """Show all project settings"""
-    info(str(Project))
+    info(Project.dump())
+
+
+@functools.lru_cache(maxsize=None)
+def _help_comment(key, required):
+    """
+    The help comment lines shown by describe for an attribute.  The help text is static, so the wrapped and
+    formatted lines are only built once per attribute.
+
+    :param key: the attribute name
+    :type key: str
+    :param required: asserted if the attribute is required
+    :type required: bool
+    :return: the comment lines
+    :rtype: tuple[str]
+    """
+    lines = ["# {key}".format(key=key)]
+    if required:
+        lines.append("# REQUIRED")
+    lines.extend("# {line}".format(line=line) for line in textwrap.wrap(ATTRIBUTES[key]['help'], width=100))
+    return tuple(lines)
 
 
 @task(namespace='project', configured='optional')
 def describe():
     """Show all project settings with descriptions"""
-    keys = Project.__dict__.keys()
-    for key in sorted(keys):
-        value = Project.__dict__[key]
-        if key in ATTRIBUTES:
-            attrs = ATTRIBUTES[key]
-            required = False
-            if 'required' in attrs:
-                if attrs['required']:
-                    required = True
+    described_value = "# '{key}': '{value}'".format
+    undescribed_value = "'{key}': '{value}'".format
+    for key, value in sorted(Project.attributes().items()):
+        attrs = ATTRIBUTES.get(key)
+        if attrs is not None:
             if 'help' in attrs:
-                info("# {key}".format(key=key))
-                if required:
-                    info("# REQUIRED")
-                for line in textwrap.wrap(attrs['help'], width=100):
-                    info("# {line}".format(line=line))
-                info("# '{key}': '{value}'".format(key=key, value=value))
+                for line in _help_comment(key, bool(attrs.get('required'))):
+                    info(line)
+                info(described_value(key=key, value=value))
                 info('')
         else:
-            info("'{key}': '{value}'".format(key=key, value=value))
+            info(undescribed_value(key=key, value=value))
 
 
 def _pip_list():
-    names = []
+    """
+    :return: the lower case names of the installed distributions
+    :rtype: set[str]
+    """
     # noinspection PyBroadException
     try:
-        # idiotic python setup tools creates empty egg directory in project that then causes pip to blow up.
-        # Wonderful python tools in action!
-        # so lets remove the stupid egg directory so we can use pip to get a listing of installed packages.
-        egg_info_dir = "{name}.egg-info".format(name=Project.name)
-        if os.path.exists(egg_info_dir):
-            shutil.rmtree(egg_info_dir)
-
-        with LocalShell() as local:
-            # if 'VIRTUAL_ENV' in os.environ:
-            # pip = os.path.join(os.environ['VIRTUAL_ENV'], 'bin', 'pip')
-            # info("PATH={path}".format(path=os.environ['PATH']))
-            # info(pip)
-            pip = local.system('which pip || which pip3', verbose=False).strip()
-            # info(pip)
-            # info("pip version: {ver}".format(ver=local.system('{pip} --version'.format(pip=pip))))
-            pip_list_output = local.run('{pip} list'.format(pip=pip))
-            # info(pip_list_output)
-            lines = pip_list_output.split("\n")
-            names = [line.split(" ")[0].lower().encode('ascii', 'ignore') for line in lines if line.strip()]
+        return set(name.lower() for name in (dist.metadata['Name'] for dist in distributions()) if name)
     except Exception:
+        return set()
+
+
+_PIP_LIST_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.herringlib_cache', 'pip_list.json')
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pip_list():
+    """
+    The installed distribution names, computed on first use.  Also cached in ~/.herringlib_cache/pip_list.json,
+    keyed by the modification times of the sys.path directories, so the installed distributions are only rescanned
+    after a package is installed or removed.
+
+    :return: the lower case names of the installed distributions
+    :rtype: frozenset[str]
+    """
+    key = [[path, os.path.getmtime(path)] for path in sys.path if os.path.isdir(path)]
+    try:
+        with open(_PIP_LIST_CACHE_FILE) as in_file:
+            cached = json.load(in_file)
+        if cached['key'] == key:
+            return frozenset(cached['names'])
+    except (IOError, ValueError, KeyError, TypeError):
         pass
 
-    return names
+    names = _pip_list()
+    try:
+        mkdir_p(os.path.dirname(_PIP_LIST_CACHE_FILE))
+        with open(_PIP_LIST_CACHE_FILE, 'w') as out_file:
+            json.dump({'key': key, 'names': sorted(names)}, out_file)
+    except (IOError, OSError) as ex:
+        debug("Can not write {file}: {err}".format(file=_PIP_LIST_CACHE_FILE, err=str(ex)))
+    return frozenset(names)
 
 
-# noinspection PyArgumentEqualDefault
-__pip_list = [pkg.decode('utf-8') for pkg in _pip_list()]
+@functools.lru_cache(maxsize=None)
+def _supported_package(requirement_line):
+    """
+    Each task module parses its requirement lines when imported and many lines are shared between modules, so
+    cache the parse.
+
+    :param requirement_line: a requirement, optionally with an environment marker
+    :type requirement_line: str
+    :return: the requirement's package name or None if the requirement does not apply to the running python
+    :rtype: str|None
+    """
+    requirement = Requirement(requirement_line)
+    if requirement.supported_python():
+        return requirement.package
+    return None
 
 
 def packages_required(package_names):
@@ -276,20 +491,26 @@ def packages_required(package_names):
     # noinspection PyBroadException
     try:
         result = True
+        pip_list = _get_pip_list()
 
         # info(package_names)
-        # info(__pip_list)
-        for requirement in [Requirement(name) for name in package_names]:
-            if requirement.supported_python():
-                pkg_name = requirement.package
-                if pkg_name.lower() not in __pip_list:
+        # info(pip_list)
+        for pkg_name in [_supported_package(name) for name in package_names]:
+            if pkg_name is not None:
+                lower_name = pkg_name.lower()
+                if lower_name in pip_list:
+                    continue
+                if lower_name not in _CHECKED:
                     try:
-                        # info('__import__("{name}")'.format(name=pkg_name))
-                        __import__(pkg_name)
+                        # info('import_module("{name}")'.format(name=pkg_name))
+                        importlib.import_module(pkg_name)
+                        _CHECKED[lower_name] = True
                     except ImportError:
                         info(pkg_name + " not installed!")
                         missing_modules.append(pkg_name)
-                        result = False
+                        _CHECKED[lower_name] = False
+                if not _CHECKED[lower_name]:
+                    result = False
         return result
     except Exception:
         return False
@@ -317,6 +538,24 @@ def check_requirements():
         info("Your %s includes all known herringlib task requirements" % 'requirements.txt')
 
 
+def _venv_python_key(venv):
+    """
+    Identify a virtualenv's python so a virtualenv that is deleted and recreated with another python is not
+    mistaken for the old one.
+
+    :param venv: the virtualenvwrapper virtualenv name
+    :type venv: str
+    :return: (bin/python path, its resolved path, its modification time in nanoseconds) or None if it does not exist
+    :rtype: tuple|None
+    """
+    workon_home = os.environ.get('WORKON_HOME', os.path.expanduser(os.path.join('~', '.virtualenvs')))
+    python = os.path.join(workon_home, venv, 'bin', 'python')
+    try:
+        return python, os.path.realpath(python), os.stat(python).st_mtime_ns
+    except OSError:
+        return None
+
+
 @task(namespace='project', configured='required')
 def environment():
     """ Display project environment """
@@ -325,7 +564,12 @@ def environment():
     project_env = {}
     if not venvs.in_virtualenv and venvs.defined:
         for venv_info in venvs.infos():
-            site_packages = venv_info.run(site_packages_cmdline).strip().splitlines()[2]
+            key = _venv_python_key(venv_info.venv)
+            site_packages = _VENV_SITE_PACKAGES.get(key) if key is not None else None
+            if site_packages is None:
+                site_packages = venv_info.run(site_packages_cmdline).strip().splitlines()[2]
+                if key is not None:
+                    _VENV_SITE_PACKAGES[key] = site_packages
             project_env[venv_info.venv + ': site-packages'] = site_packages
     else:
         with LocalShell() as local:
@@ -4,6 +4,32 @@ User query
 """
 import sys
 
+try:
+    # noinspection PyUnresolvedReferences,PyCompatibility
+    _input = raw_input
+except NameError:
+    _input = input
+
+_VALID_ANSWERS = {"yes": True, "y": True, "ye": True,
+                  "no": False, "n": False}
+
+
+def _read_line():
+    """
+    Read a line of user input.  When stdin is not a terminal (ex: scripted runs), read it directly instead of
+    going through input()'s readline handling.
+
+    :return: the line without the trailing newline
+    :rtype: str
+    """
+    if sys.stdin.isatty():
+        return _input()
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError('EOF when reading a line')
+    return line.rstrip('\n')
+
 
 def query_yes_no(question, default="yes"):
     """Ask a yes/no question via raw_input() and return their answer.
@@ -15,8 +41,6 @@ def query_yes_no(question, default="yes"):
 
     :return: The "answer" return value is True for "yes", False for "no".
     """
-    valid = {"yes": True, "y": True, "ye": True,
-             "no": False, "n": False}
     if default is None:
         prompt_str = " [y/n] "
     elif default == "yes":
@@ -26,18 +50,15 @@ def query_yes_no(question, default="yes"):
     else:
         raise ValueError("invalid default answer: '%s'" % default)
 
+    question += prompt_str
     while True:
-        sys.stdout.write(question + prompt_str)
-        try:
-            # noinspection PyUnresolvedReferences,PyCompatibility
-            choice = raw_input().lower()
-        except NameError:
-            choice = input().lower()
+        sys.stdout.write(question)
+        choice = _read_line().lower()
 
         if default is not None and choice == '':
-            return valid[default]
-        elif choice in valid:
-            return valid[choice]
+            return _VALID_ANSWERS[default]
+        elif choice in _VALID_ANSWERS:
+            return _VALID_ANSWERS[choice]
         else:
             sys.stdout.write("Please respond with 'yes' or 'no' (or 'y' or 'n').\n")
 
@@ -59,11 +80,7 @@ def prompt(question, default=None):
         prompt_str = " [{default}] ".format(default=str(default))
 
     sys.stdout.write(question + prompt_str)
-    try:
-        # noinspection PyUnresolvedReferences,PyCompatibility
-        choice = raw_input()
-    except NameError:
-        choice = input()
+    choice = _read_line()
     if choice == '':
         return default
     return choice
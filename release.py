@@ -4,9 +4,17 @@
 Release your code into the wild!
 
 Supports releasing to Pypi (pypi, pypi-test, readthedocs) and Github.
+
+Add the following to your *requirements.txt* file:
+
+* twine
+
 """
 
+import functools
 import os
+import shutil
+import tempfile
 
 try:
     # noinspection PyUnresolvedReferences
@@ -18,26 +26,71 @@ try:
     # noinspection PyUnresolvedReferences
     from herringlib.local_shell import LocalShell
     # noinspection PyUnresolvedReferences
+    from herringlib.mkdir_p import mkdir_p
+    # noinspection PyUnresolvedReferences
     from herringlib.simple_logger import error
     # noinspection PyUnresolvedReferences
     from herringlib.prompt import query_yes_no
+    _HAVE_HERRING = True
 except ImportError as ex:
     # noinspection PyUnresolvedReferences
     from herringlib.simple_logger import error
     error("Problem importing:  {msg}".format(msg=str(ex)))
+    _HAVE_HERRING = False
 
 # noinspection PyUnusedName
 __docformat__ = 'restructuredtext en'
 
-if Project.package:
+
+@functools.lru_cache(maxsize=None)
+def _project_version(package):
+    """
+    :param package: the project's package
+    :type package: str
+    :return: the project's version, read once per release run
+    :rtype: str
+    """
+    return get_project_version(package)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_sdist(version):
+    """
+    Build the source distribution once per release run so the pypi-test and pypi uploads share it.
+
+    :param version: the project's version, so a new version gets a new build
+    :type version: str
+    :return: path to the source distribution
+    :rtype: str
+    :raises IOError: if the build did not produce exactly one source distribution
+    """
+    # setuptools normalizes the name and version in the sdist's file name, so build into an empty directory
+    # and take whatever archive it produced instead of guessing the file name
+    build_dir = tempfile.mkdtemp()
+    try:
+        with LocalShell() as local:
+            local.run('python setup.py sdist --dist-dir {dir}'.format(dir=build_dir))
+        sdists = [name for name in os.listdir(build_dir) if name.endswith('.tar.gz')]
+        if len(sdists) != 1:
+            raise IOError("Expected one source distribution in {dir}, found: {sdists}".format(dir=build_dir,
+                                                                                          sdists=sdists))
+        mkdir_p(Project.dist_dir)
+        sdist = os.path.join(Project.dist_dir, sdists[0])
+        shutil.move(os.path.join(build_dir, sdists[0]), sdist)
+    finally:
+        shutil.rmtree(build_dir, ignore_errors=True)
+    return sdist
+
+
+if _HAVE_HERRING and Project.package:
     with namespace('release'):
         # noinspection PyUnusedFunction
         @task()
         def changes_since_last_tag():
             """show the changes since the last tag"""
             with LocalShell() as local:
-                last_tag = local.run('git describe --tags --abbrev=0').strip()
-                print("\n" + local.run(['git', 'log', '{tag}..HEAD'.format(tag=last_tag), '--oneline']))
+                # one shell resolves the last tag and logs since it
+                print("\n" + local.run('/bin/bash -c "git log $(git describe --tags --abbrev=0)..HEAD --oneline"'))
 
 
         @task()
@@ -46,26 +99,24 @@ if Project.package:
             with LocalShell() as local:
                 local.run('git tag {name}-{ver} -m "Adds a tag so we can put this on PyPI"'.format(
                     name=Project.package,
-                    ver=get_project_version(Project.package)))
+                    ver=_project_version(Project.package)))
                 local.run('git push --tags origin master')
 
 
         @task()
         def pypi_test():
-            """register and upload package to pypi-test"""
-            # TODO use twine to upload to PyPI (https://pypi.python.org/pypi/twine)
+            """upload package to pypi-test"""
+            sdist = _build_sdist(_project_version(Project.package))
             with LocalShell() as local:
-                local.run('python setup.py register -r test')
-                local.run('python setup.py sdist upload -r test')
+                local.run('twine upload -r test {sdist}'.format(sdist=sdist))
 
 
         @task()
         def pypi_live():
-            """register and upload package to pypi"""
-            # TODO use twine to upload to PyPI (https://pypi.python.org/pypi/twine)
+            """upload package to pypi"""
+            sdist = _build_sdist(_project_version(Project.package))
             with LocalShell() as local:
-                local.run('python setup.py register -r pypi')
-                local.run('python setup.py sdist upload -r pypi')
+                local.run('twine upload -r pypi {sdist}'.format(sdist=sdist))
 
 
         @task()
@@ -20,16 +20,19 @@ Add the following to your *requirements.txt* file:
 * scp; python_version == "[python_versions]"
 
 """
+import os
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
+# noinspection PyUnresolvedReferences
+from herringlib.mkdir_p import mkdir_p
 # noinspection PyUnresolvedReferences
 from herringlib.simple_logger import info
 # noinspection PyUnresolvedReferences
 from herringlib.project_settings import Project
 
 import sys
-import re
-from time import sleep
+from time import sleep, time
 from getpass import getpass
 
 # noinspection PyUnresolvedReferences
@@ -65,6 +68,9 @@ from .ashell import AShell, CR, MOVEMENT
 __docformat__ = 'restructuredtext en'
 __all__ = ('RemoteShell',)
 
+# concurrent sftp transfers per get()
+SFTP_WORKERS = 8
+
 
 class RemoteShell(AShell):
     """
@@ -113,6 +119,7 @@ class RemoteShell(AShell):
             self.ssh.login(host, user, password)
         self.accept_defaults = False
         self.logfile = logfile
+        self._transfer_ssh = None
         self.prefix = []
         self.postfix = []
         if environment:
@@ -131,16 +138,53 @@ class RemoteShell(AShell):
         # noinspection PyBroadException
         try:
             for line in self.run('env').split("\n"):
-                match = re.match(r'([^=]+)=(.*)', line)
-                if match:
-                    environ[match.group(1).strip()] = match.group(2).strip()
+                key, sep, value = line.partition('=')
+                if sep and key:
+                    environ[key.strip()] = value.strip()
         except:
             pass
         return environ
 
+    def _transfer_client(self):
+        """
+        Get the paramiko connection used for file transfers, connecting on first use.
+
+        :return: the connected ssh client
+        :rtype: SSHClient
+        """
+        transport = self._transfer_ssh.get_transport() if self._transfer_ssh is not None else None
+        if transport is None or not transport.is_active():
+            if self._transfer_ssh is not None:
+                self._transfer_ssh.close()
+            ssh = SSHClient()
+            ssh.load_system_host_keys()
+            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            ssh.connect(Project.address, Project.port, Project.user, Project.password)
+            self._transfer_ssh = ssh
+        return self._transfer_ssh
+
+    def _drain(self, limit=0.02):
+        """
+        Discard any output already waiting on the ssh session without waiting for more to arrive.
+
+        :param limit: the maximum time in seconds to spend draining a session that keeps producing output
+        :type limit: float
+        """
+        # output already read by the previous expect() but not matched is pending too
+        self.ssh.buffer = self.ssh.string_type()
+        end = time() + limit
+        try:
+            while self.ssh.read_nonblocking(size=4096, timeout=0) and time() < end:
+                pass
+        except (pexpect.TIMEOUT, pexpect.EOF):
+            pass
+
     def _report(self, output, out_stream, verbose):
         def _out_string(value):
             if value:
+                # pxssh hands back bytes, decode each chunk once here
+                if isinstance(value, bytes):
+                    value = value.decode('utf-8')
                 if isinstance(value, str):
                     self.display(value, out_stream=out_stream, verbose=verbose)
                     output.append(value)
@@ -186,8 +230,7 @@ class RemoteShell(AShell):
 
         output = []
 
-        self.ssh.prompt(timeout=0.1)     # clear out any pending prompts
-        self._report(output, out_stream=out_stream, verbose=verbose)
+        self._drain()     # clear out any pending prompts
         self.ssh.sendline(command_line)
         while True:
             try:
@@ -209,7 +252,7 @@ class RemoteShell(AShell):
                 break
         self.ssh.prompt(timeout=0.1)
         self._report(output, out_stream=out_stream, verbose=verbose)
-        return ''.join(output).splitlines()
+        return ''.join(output)
 
     # noinspection PyUnusedLocal
     def run(self, cmd_args, out_stream=sys.stdout, env=None, verbose=True,
@@ -260,22 +303,23 @@ class RemoteShell(AShell):
                 prefix = prefix + env_args
 
         if pattern_response or accept_defaults or self.accept_defaults:
-            buf = self.run_pattern_response(cmd_args, out_stream=out_stream, verbose=verbose,
-                                            prefix=prefix, postfix=postfix,
-                                            pattern_response=pattern_response,
-                                            accept_defaults=accept_defaults or self.accept_defaults,
-                                            timeout=timeout)
+            output = self.run_pattern_response(cmd_args, out_stream=out_stream, verbose=verbose,
+                                               prefix=prefix, postfix=postfix,
+                                               pattern_response=pattern_response,
+                                               accept_defaults=accept_defaults or self.accept_defaults,
+                                               timeout=timeout)
         else:
             args = self.expand_args(cmd_args, prefix=prefix, postfix=postfix)
             command_line = ' '.join(args)
             self.display("{line}\n".format(line=command_line), out_stream=out_stream, verbose=verbose)
-            self.ssh.prompt(timeout=.1)     # clear out any pending prompts
+            self._drain()     # clear out any pending prompts
             self.ssh.sendline(command_line)
             self.ssh.prompt(timeout=timeout)
             buf = [self.ssh.before.decode('utf-8')]
             if self.ssh.after:
                 buf.append(self.ssh.after.decode('utf-8'))
-        return ''.join(buf)
+            output = ''.join(buf)
+        return output
 
     def put(self, files, remote_path=None, out_stream=sys.stdout, verbose=False):
         """
@@ -293,11 +337,7 @@ class RemoteShell(AShell):
                      out_stream=out_stream, verbose=verbose)
         info("\naddress: {address}".format(address=Project.address))
         info("port: {port}".format(port=Project.port))
-        ssh = SSHClient()
-        ssh.load_system_host_keys()
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        ssh.connect(Project.address, Project.port, Project.user, Project.password)
-        scp = SCPClient(ssh.get_transport())
+        scp = SCPClient(self._transfer_client().get_transport())
         # scp = SCPClient(self.ssh.get_transport())
         # noinspection PyBroadException
         try:
@@ -330,19 +370,31 @@ class RemoteShell(AShell):
         self.display("scp '{src}' '{dest}'".format(src=remote_path, dest=local_path),
                      out_stream=out_stream, verbose=verbose)
 
-        names = self.run(['ls', '-1', remote_path]).split('\n')
+        names = [name.strip() for name in self.run(['ls', '-1', remote_path]).split('\n') if name.strip()]
 
-        ssh = SSHClient()
-        ssh.load_system_host_keys()
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        ssh.connect(Project.address, Project.port, Project.user, Project.password)
         # scp = SFTPClient.from_transport(ssh.get_transport())
         # output = scp.get(remote_path, local_path, recursive=True)
 
-        ftp = ssh.open_sftp()
-        for name in names:
+        # several files go into the local_path directory instead of each overwriting the same local file
+        if len(names) > 1 or os.path.isdir(local_path):
+            mkdir_p(local_path)
+            destinations = [os.path.join(local_path, os.path.basename(name)) for name in names]
+        else:
+            destinations = [local_path] * len(names)
+
+        transport = self._transfer_client().get_transport()
+
+        def _get(name, destination):
             print(name)
-            ftp.get(name, local_path)
+            # an SFTPClient is not thread safe, so each download gets its own channel over the shared transport
+            ftp = paramiko.SFTPClient.from_transport(transport)
+            try:
+                ftp.get(name, destination)
+            finally:
+                ftp.close()
+
+        with ThreadPoolExecutor(max_workers=SFTP_WORKERS) as executor:
+            list(executor.map(_get, names, destinations))
 
         output = repr(names)
         self.display(output, out_stream=out_stream, verbose=verbose)
@@ -363,3 +415,6 @@ class RemoteShell(AShell):
         if self.ssh:
             self.ssh.logout()
             self.ssh = None
+        if self._transfer_ssh is not None:
+            self._transfer_ssh.close()
+            self._transfer_ssh = None
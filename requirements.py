@@ -60,21 +60,234 @@ Then Project::mkvenvs will create the virtualenv and install the packages from t
 
 """
 import ast
-import fnmatch
+import atexit
+import functools
+import inspect
+import json
 import os
 from pprint import pformat
 import re
+import sys
+import tokenize
 
-from operator import itemgetter
+from operator import eq, ge, gt, itemgetter, le, lt, ne
 from itertools import groupby
 
 from herring.herring_app import task, task_execute
 from herring.herring_file import HerringFile
 from herringlib.comparable_mixin import ComparableMixin
 from herringlib.list_helper import compress_list, is_sequence, unique_list
+from herringlib.mkdir_p import mkdir_p
 from herringlib.simple_logger import debug, warning
 
 
+# process wide index of the .py files in each herringlib directory, see _index()
+_INDEX = {}
+
+
+def _iter_py(path, dir_mtimes=None):
+    """
+    Recursively yield the paths of the .py files under the given directory.
+
+    :param path: directory to scan
+    :type path: str
+    :param dir_mtimes: optional dictionary that collects the modification time in nanoseconds of each scanned directory
+    :type dir_mtimes: dict[str,int]|None
+    :return: generator of .py file paths
+    :rtype: collections.Iterable[str]
+    """
+    try:
+        if dir_mtimes is not None:
+            dir_mtimes[path] = os.stat(path).st_mtime_ns
+        entries = list(os.scandir(path))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            for file_path in _iter_py(entry.path, dir_mtimes):
+                yield file_path
+        elif entry.name.endswith('.py') and entry.is_file(follow_symlinks=False):
+            yield entry.path
+
+
+def _stale(dir_mtimes):
+    """
+    Adding, removing, or renaming a file changes the modification time of its directory.
+
+    :param dir_mtimes: the modification time in nanoseconds of each directory when it was indexed
+    :type dir_mtimes: dict[str,int]
+    :return: asserted if any of the directories have changed since they were indexed
+    :rtype: bool
+    """
+    for dir_path, mtime in dir_mtimes.items():
+        try:
+            if os.stat(dir_path).st_mtime_ns != mtime:
+                return True
+        except OSError:
+            return True
+    return False
+
+
+def _index(path):
+    """
+    Get the .py files under the given directory, rescanning only when the directory tree has changed.
+
+    :param path: directory to scan
+    :type path: str
+    :return: list of .py file paths
+    :rtype: list[str]
+    """
+    entries = _INDEX.get(path)
+    if entries is None or _stale(entries[0]):
+        dir_mtimes = {}
+        entries = (dir_mtimes, list(_iter_py(path, dir_mtimes)))
+        _INDEX[path] = entries
+    return list(entries[1])
+
+
+def _leading_docstring(readline):
+    """
+    Get the module docstring by reading tokens up to the first statement instead of parsing the whole module.
+
+    :param readline: readline method of a module file opened in binary mode
+    :type readline: collections.Callable
+    :return: the cleaned module docstring or an empty string if the module does not have one
+    :rtype: str
+    """
+    skip = (tokenize.ENCODING, tokenize.COMMENT, tokenize.NL, tokenize.NEWLINE)
+    parts = []
+    try:
+        for token in tokenize.tokenize(readline):
+            if token.type in skip and not parts:
+                continue
+            if token.type == tokenize.STRING:
+                parts.append(ast.literal_eval(token.string))
+                continue
+            # the leading string(s) are only the docstring when they make up the whole first statement
+            if parts and (token.type in (tokenize.COMMENT, tokenize.NEWLINE, tokenize.ENDMARKER) or
+                          token.string == ';'):
+                break
+            return ''
+    except (tokenize.TokenError, SyntaxError, ValueError):
+        return ''
+    if not parts or not all(isinstance(part, str) for part in parts):
+        return ''
+    return inspect.cleandoc(''.join(parts)).strip()
+
+
+class DocstringCache(object):
+    """
+    Persistent cache of module docstrings keyed by the module's path and validated by its mtime_ns and size.
+
+    The cache file is append-only JSON lines, one ``{"path": ..., "mtime_ns": ..., "size": ..., "doc": ...}``
+    object per line.  When loading, the latest line for each path wins.  The file is compacted on load when
+    it holds more superseded lines than current ones.
+    """
+
+    def __init__(self, cache_file):
+        self.cache_file = cache_file
+        self._entries = None
+        self._out_file = None
+
+    def _load(self):
+        self._entries = {}
+        lines = 0
+        try:
+            with open(self.cache_file) as in_file:
+                for line in in_file:
+                    try:
+                        entry = json.loads(line)
+                        self._entries[entry['path']] = entry
+                        lines += 1
+                    except (ValueError, KeyError, TypeError):
+                        pass
+        except (IOError, OSError):
+            return
+        if lines > 2 * len(self._entries):
+            self._compact()
+
+    def _compact(self):
+        tmp_file = self.cache_file + '.tmp'
+        try:
+            with open(tmp_file, 'w') as out_file:
+                for entry in self._entries.values():
+                    out_file.write(json.dumps(entry) + '\n')
+            os.rename(tmp_file, self.cache_file)
+        except (IOError, OSError) as ex:
+            debug("Can not compact {file}: {err}".format(file=self.cache_file, err=str(ex)))
+
+    def get(self, path, stat):
+        """
+        :param path: the module path
+        :type path: str
+        :param stat: the module's current os.stat() result
+        :type stat: os.stat_result
+        :return: the cached docstring or None if not cached or stale
+        :rtype: str|None
+        """
+        if self._entries is None:
+            self._load()
+        entry = self._entries.get(path)
+        if entry is not None and entry.get('mtime_ns') == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return entry['doc']
+        return None
+
+    def put(self, path, stat, doc):
+        """
+        Cache the docstring, appending it to the cache file.
+
+        :param path: the module path
+        :type path: str
+        :param stat: the module's os.stat() result
+        :type stat: os.stat_result
+        :param doc: the module's docstring
+        :type doc: str
+        """
+        if self._entries is None:
+            self._load()
+        entry = {'path': path, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'doc': doc}
+        self._entries[path] = entry
+        try:
+            if self._out_file is None:
+                mkdir_p(os.path.dirname(self.cache_file))
+                self._out_file = open(self.cache_file, 'a')
+            self._out_file.write(json.dumps(entry) + '\n')
+        except (IOError, OSError) as ex:
+            debug("Can not write {file}: {err}".format(file=self.cache_file, err=str(ex)))
+
+    def close(self):
+        """Flush any appended entries to disk."""
+        if self._out_file is not None:
+            try:
+                self._out_file.flush()
+                os.fsync(self._out_file.fileno())
+                self._out_file.close()
+            except (IOError, OSError):
+                pass
+            self._out_file = None
+
+
+_DOCSTRING_CACHE = DocstringCache(os.path.join(os.path.expanduser('~'), '.herringlib_cache', 'docstrings.jsonl'))
+atexit.register(_DOCSTRING_CACHE.close)
+
+
+# name, operator, and version list of an environment marker, ex: python_version in '2.7 3.8'
+_MARKER_REGEX = re.compile(r'''(\S+)\s*((?:[!=<>]+)|(?:not in)|(?<!not )in)\s*[\"\']?([\d.\s]+)[\"\']?''')
+
+
+# python_version marker operators, applied to (sys.version, marker version)
+_MARKER_OPERATORS = {
+    '==': eq,
+    '!=': ne,
+    '<': lt,
+    '<=': le,
+    '>': gt,
+    '>=': ge,
+    'in': lambda version, versions: version in versions,
+    'not in': lambda version, versions: version not in versions,
+}
+
+
 class EnvironmentMarker(object):
     """
     On a requirement the environment marker is to the right of a semi-colon.
@@ -85,9 +298,9 @@ class EnvironmentMarker(object):
         self.name = None
         self.operator = None
         self.value = None
+        self._str = None
         if self.marker is not None:
-            match = re.match(r'''(\S+)\s*((?:[!=<>]+)|(?:not in)|(?<!not )in)\s*[\"\']?([\d.\s]+)[\"\']?''',
-                             self.marker)
+            match = _MARKER_REGEX.match(self.marker)
             if match:
                 self.name = match.group(1)
                 self.operator = match.group(2)
@@ -95,8 +308,15 @@ class EnvironmentMarker(object):
                 debug("EnvironmentMarker:\n  {marker}\n  raw='{raw}'".format(marker=self, raw=match.group(3)))
 
     def __str__(self):
-        value_str = "'{v}'".format(v=' '.join(self.value))
-        return "{name} {operator} {value}".format(name=self.name, operator=self.operator, value=value_str)
+        if self._str is None:
+            value_str = "'{v}'".format(v=' '.join(self.value))
+            self._str = "{name} {operator} {value}".format(name=self.name, operator=self.operator, value=value_str)
+        return self._str
+
+
+# used for every requirements.txt line and docstring bullet, so compile once
+_EGG_REGEX = re.compile(r'(.*?#egg=[^\s;]+)')
+_PACKAGE_SPLIT_REGEX = re.compile(r'[^a-zA-Z0-9_\-]')
 
 
 class Requirement(ComparableMixin):
@@ -119,15 +339,21 @@ class Requirement(ComparableMixin):
         if self.line.startswith('"') and self.line.endswith('"'):
             self.line = self.line[1:-1]
         debug("Requirement: {line}".format(line=self.line))
-        match = re.match(r'(.*?#egg=[^\s;]+)', self.line)
+        # str() is the comparison key, so it is cached until merge() changes the markers
+        self._str = None
+        # only editable/VCS lines name their package with #egg=, so most lines skip that match entirely
+        match = _EGG_REGEX.match(self.line) if '#egg=' in self.line else None
         if match:
             self.package = match.group(1).strip().strip(';')
         else:
-            self.package = re.split(r'[^a-zA-Z0-9_\-]', self.line)[0].strip().strip(';')
-        self.qualified_package = re.split(r';', self.line)[0].strip()
-        try:
-            self.markers = [EnvironmentMarker(re.split(r';', self.line)[1].strip().replace('"', "'"))]
-        except IndexError:
+            # the leading run of name characters can not contain whitespace or ';'
+            self.package = _PACKAGE_SPLIT_REGEX.split(self.line, 1)[0]
+        qualified_package, semicolon, marker = self.line.partition(';')
+        self.qualified_package = qualified_package.strip()
+        if semicolon:
+            # only the first marker is used
+            self.markers = [EnvironmentMarker(marker.partition(';')[0].strip().replace('"', "'"))]
+        else:
             self.markers = []
 
     def merge(self, other):
@@ -138,26 +364,23 @@ class Requirement(ComparableMixin):
         :type other: Requirement
         """
         new_markers = {}
-        for marker in self.markers:
-            key = "{name} {operator}".format(name=marker.name, operator=marker.operator)
-            if key not in new_markers:
-                new_markers[key] = []
-            new_markers[key].extend(marker.value)
-        for marker in other.markers:
-            key = "{name} {operator}".format(name=marker.name, operator=marker.operator)
-            if key not in new_markers:
-                new_markers[key] = []
-            new_markers[key].extend(marker.value)
+        for marker in self.markers + other.markers:
+            new_markers.setdefault((marker.name, marker.operator), []).extend(marker.value)
         self.markers = []
-        for key in new_markers:
-            name, operator = key.split(' ')
-            value = sorted(list(set(new_markers[key])))
+        self._str = None
+        for (name, operator), values in new_markers.items():
+            value = sorted(dict.fromkeys(values))
             debug("merge => {name} {operator} {value}".format(name=name,
                                                               operator=operator,
                                                               value=value))
-            self.markers.append(EnvironmentMarker("{name} {operator} {value}".format(name=name,
-                                                                                     operator=operator,
-                                                                                     value=' '.join(value))))
+            # the parts are already known, so build the marker instead of parsing its text again
+            marker = EnvironmentMarker(None)
+            marker.marker = "{name} {operator} {value}".format(name=name, operator=operator, value=' '.join(value))
+            marker.name = name
+            marker.operator = operator
+            # parsing the marker text skipped leading blanks, so an empty version was only kept on its own
+            marker.value = [version for version in value if version] or ['', '']
+            self.markers.append(marker)
 
     def _cmpkey(self):
         return self.__str__()
@@ -166,10 +389,13 @@ class Requirement(ComparableMixin):
         return hash(self.line)
 
     def __str__(self):
-        if self.markers:
-            marker_str = '; '.join([str(m) for m in self.markers])
-            return '{package}; {marker}'.format(package=self.package, marker=marker_str)
-        return self.package
+        if self._str is None:
+            if self.markers:
+                marker_str = '; '.join([str(m) for m in self.markers])
+                self._str = '{package}; {marker}'.format(package=self.package, marker=marker_str)
+            else:
+                self._str = self.package
+        return self._str
 
     def qualified(self, qualifiers):
         if qualifiers:
@@ -200,23 +426,48 @@ class Requirement(ComparableMixin):
         """
         for marker in [m for m in self.markers if m.name == 'python_version']:
             if marker.operator is not None and marker.value is not None:
-                # noinspection PyUnresolvedReferences
-                import sys
-
-                version = marker.value[0]
-                code = "sys.version {operator} \"{version}\"".format(operator=marker.operator, version=version)
-                result = eval(code)
-                debug("{code} returned: {result}".format(code=code, result=str(result)))
+                compare = _MARKER_OPERATORS.get(marker.operator)
+                if compare is None:
+                    raise ValueError("Unsupported environment marker operator: {marker}".format(marker=marker.marker))
+                result = compare(sys.version, marker.value[0])
+                debug("sys.version {operator} '{version}' returned: {result}".format(
+                    operator=marker.operator, version=marker.value[0], result=str(result)))
                 return result
         return True
 
 
+@functools.lru_cache(maxsize=4096)
+def _parsed_requirement(line):
+    return Requirement(line)
+
+
+def _make_requirement(line):
+    """
+    Get a Requirement for the line, parsing each distinct line only once.
+
+    Requirements are mutable (see Requirement.merge), so each call gets its own copy of the cached one.
+
+    :param line: requirements.txt line or docstring bullet text
+    :type line: str
+    :return: the requirement
+    :rtype: Requirement
+    """
+    requirement = Requirement.__new__(Requirement)
+    requirement.__dict__.update(_parsed_requirement(line).__dict__)
+    return requirement
+
+
+# docstring variable reference, ex: [python_versions]
+_VARIABLE_REGEX = re.compile(r'\[([^\]]+)]')
+_PYTHON_VERSION_EQ_REGEX = re.compile(r"python_version\s*==\s*")
+
+
 class Requirements(object):
     """
     Object for managing requirements files.
     """
-    REQUIREMENT_REGEX = r'([^*\s"\']*requirements\.txt)'
-    ITEM_REGEX = r'^\s*\*\s+(.+)\s*$'
+    REQUIREMENT_REGEX = re.compile(r'([^*\s"\']*requirements\.txt)')
+    ITEM_REGEX = re.compile(r'^\s*\*\s+(.+)\s*$')
 
     def __init__(self, project):
         self._project = project
@@ -234,8 +485,8 @@ class Requirements(object):
                 requirement_dict[requirement.package].merge(requirement)
         return requirement_dict.values()
 
-    def _find_item_groups(self, lines):
-        item_indexes = [i for i, item in enumerate(lines) if re.match(self.ITEM_REGEX, item)]
+    # noinspection PyMethodMayBeStatic
+    def _find_item_groups(self, item_indexes):
         debug("item_indexes: %s" % repr(item_indexes))
 
         item_groups = []
@@ -247,15 +498,15 @@ class Requirements(object):
         lines = []
         for line in raw_lines:
 
-            match = re.search(r'\[([^\]]+)]', line)
+            match = _VARIABLE_REGEX.search(line)
             if match:
                 value = getattr(self._project, match.group(1), match.group(0))
                 if not is_sequence(value):
                     value = [value]
                 new_lines = []
 
-                line = re.sub(r"python_version\s*==\s*", r"python_version in ", line)
-                line = re.sub(r'\[([^\]]+)]', ' '.join([self._project.ver_to_version(v) for v in value]), line)
+                line = _PYTHON_VERSION_EQ_REGEX.sub(r"python_version in ", line)
+                line = _VARIABLE_REGEX.sub(' '.join([self._project.ver_to_version(v) for v in value]), line)
                 new_lines.append(line)
             else:
                 new_lines = [line]
@@ -283,7 +534,8 @@ class Requirements(object):
         requirements = {}
 
         debug("_parse_docstring")
-        if doc_string is None or not doc_string:
+        # most modules do not list any requirements, so skip the line scan unless a requirements file is named
+        if doc_string is None or 'requirements.txt' not in doc_string:
             return requirements
 
         raw_lines = list(filter(str.strip, doc_string.splitlines()))
@@ -297,19 +549,21 @@ class Requirements(object):
 
         requirement_filename = None
         requirement_dict = {}
+        item_texts = {}
         for i, item in enumerate(lines):
-            match = re.search(self.REQUIREMENT_REGEX, item)
+            item_match = self.ITEM_REGEX.match(item)
+            if item_match:
+                item_texts[i] = item_match.group(1)
+            match = self.REQUIREMENT_REGEX.search(item)
             if match:
                 requirement_filename = match.group()
             if requirement_filename:
-                if requirement_filename not in requirement_dict.keys():
-                    requirement_dict[requirement_filename] = []
-                requirement_dict[requirement_filename].append(i)
+                requirement_dict.setdefault(requirement_filename, []).append(i)
 
         # debug("requirement_indexes: %s" % repr(requirement_indexes))
         debug("requirement_indexes: %s" % repr(requirement_dict))
 
-        item_groups = self._find_item_groups(lines)
+        item_groups = self._find_item_groups(sorted(item_texts))
         # print("item_groups: %s" % repr(item_groups))
 
         # example using doc_string:
@@ -324,17 +578,15 @@ class Requirements(object):
         #       [lines[13], lines[14]],
         #   ]
 
-        for requirement_filename in requirement_dict.keys():
-            if requirement_filename not in requirements.keys():
-                requirements[requirement_filename] = []
+        groups_by_start = dict((item_group[0], item_group) for item_group in item_groups)
+        for requirement_filename, indexes in requirement_dict.items():
+            file_requirements = requirements.setdefault(requirement_filename, [])
 
-            for index in requirement_dict[requirement_filename]:
-                for item_group in item_groups:
-                    if item_group[0] == index + 1:
-                        # yes we have items for the requirement file
-                        requirements[requirement_filename].extend(
-                            [Requirement(re.match(self.ITEM_REGEX, lines[item_index]).group(1))
-                             for item_index in item_group])
+            for index in indexes:
+                item_group = groups_by_start.get(index + 1)
+                if item_group is not None:
+                    # yes we have items for the requirement file
+                    file_requirements.extend([_make_requirement(item_texts[item_index]) for item_index in item_group])
 
         debug("requirements:\n%s" % pformat(requirements))
         return requirements
@@ -350,10 +602,21 @@ class Requirements(object):
         :rtype: str
         """
         debug("_get_module_docstring('{file}')".format(file=file_path))
-        tree = ast.parse(''.join(open(file_path)))
-        # noinspection PyArgumentEqualDefault
-        docstring = (ast.get_docstring(tree, clean=True) or '').strip()
+        cache_key = os.path.abspath(file_path)
+        try:
+            stat = os.stat(file_path)
+            docstring = _DOCSTRING_CACHE.get(cache_key, stat)
+            if docstring is not None:
+                debug("cached docstring: %s" % docstring)
+                return docstring
+            with open(file_path, 'rb') as in_file:
+                docstring = _leading_docstring(in_file.readline)
+        except (IOError, OSError) as ex:
+            # one unreadable file should not stop the scan of the rest
+            warning("Can not read {file}: {err}".format(file=file_path, err=str(ex)))
+            return ''
         debug("docstring: %s" % docstring)
+        _DOCSTRING_CACHE.put(cache_key, stat, docstring)
         return docstring
 
     # noinspection PyMethodMayBeStatic
@@ -362,9 +625,7 @@ class Requirements(object):
         lib_files = []
         debug("HerringFile.herringlib_paths: %s" % repr(HerringFile.herringlib_paths))
         for herringlib_path in [os.path.join(path_, 'herringlib') for path_ in HerringFile.herringlib_paths]:
-            for dir_path, dir_names, files in os.walk(herringlib_path):
-                for f in fnmatch.filter(files, '*.py'):
-                    lib_files.append(os.path.join(dir_path, f))
+            lib_files.extend(_index(herringlib_path))
 
         return lib_files
 
@@ -384,16 +645,20 @@ class Requirements(object):
             lib_files.append(os.path.join(self._project.herringfile_dir, 'herringfile'))
         debug("files: %s" % repr(lib_files))
         requirements = {}
+        # requirements compare by their string form, so track the ones already collected by it
+        collected_strs = {}
         for file_ in lib_files:
             debug('file: %s' % file_)
             required_files_dict = self._parse_docstring(self._get_module_docstring(file_))
             debug('required_files: %s' % pformat(required_files_dict))
-            for requirement_filename in required_files_dict.keys():
-                if requirement_filename not in requirements.keys():
-                    requirements[requirement_filename] = []
-                for req in required_files_dict[requirement_filename]:
-                    if req not in requirements[requirement_filename]:
-                        requirements[requirement_filename].append(req)
+            for requirement_filename, file_requirements in required_files_dict.items():
+                collected = requirements.setdefault(requirement_filename, [])
+                seen = collected_strs.setdefault(requirement_filename, set())
+                for req in file_requirements:
+                    req_str = str(req)
+                    if req_str not in seen:
+                        seen.add(req_str)
+                        collected.append(req)
         return requirements
 
     def find_missing_requirements(self, lib_files=None):
@@ -408,27 +673,28 @@ class Requirements(object):
         """
         requirements_dict = self._get_requirements_dict_from_py_files(lib_files=lib_files)
         diff_dict = {}
-        for requirement_filename in requirements_dict.keys():
-            requirements = self._reduce_by_version(requirements_dict[requirement_filename])
+        for requirement_filename, file_requirements in requirements_dict.items():
+            requirements = self._reduce_by_version(file_requirements)
             debug('requirements:')
             debug(pformat(requirements))
 
-            needed = []
-            needed.extend(sorted(compress_list(unique_list(requirements))))
+            needed = sorted(set(compress_list(requirements)))
             if not os.path.exists(requirement_filename):
                 debug("Missing: " + requirement_filename)
-                diff_dict[requirement_filename] = sorted(set(needed))
+                diff_dict[requirement_filename] = needed
             else:
+                # requirements compare by their string form, so index the existing ones by it
+                existing = set()
                 with open(requirement_filename) as in_file:
-                    existing_requirements = []
-                    for line in [line.strip() for line in in_file.readlines()]:
-                        if line and not line.startswith('#'):
-                            existing_requirements.append(Requirement(line))
-                    existing = sorted(compress_list(unique_list(existing_requirements)))
-                    difference = [req for req in needed if req not in existing]
-                    diff_dict[requirement_filename] = sorted(set([req for req in difference
-                                                                  if not req.markers or
-                                                                  Requirement(req.package) not in needed]))
+                    for line in in_file:
+                        line = line.strip()
+                        if line and line[0] != '#':
+                            existing.add(str(_make_requirement(line)))
+                # a bare package name's string form is the package itself
+                needed_names = set(str(req) for req in needed)
+                diff_dict[requirement_filename] = sorted(set(req for req in needed
+                                                             if str(req) not in existing and
+                                                             (not req.markers or req.package not in needed_names)))
             debug("find_missing_requirements.needed: {pkgs}".format(pkgs=pformat(needed)))
             debug("find_missing_requirements.diff: {pkgs}".format(pkgs=pformat(diff_dict[requirement_filename])))
         return diff_dict
@@ -440,23 +706,16 @@ class Requirements(object):
         """
         debug("requiredFiles")
         needed_dict = Requirements(self._project).find_missing_requirements()
-        for filename in needed_dict.keys():
-            needed = needed_dict[filename]
+        for filename, needed in needed_dict.items():
             debug("needed: %s" % repr(needed))
+            ordered = sorted(unique_list(list(needed)))
             try:
                 requirements_filename = os.path.join(self._project.herringfile_dir, filename)
-                if not os.path.isfile(requirements_filename):
-                    with open(requirements_filename, 'w') as req_file:
-                        req_file.write('-e .\n\n')
+                header = '' if os.path.isfile(requirements_filename) else '-e .\n\n'
+                out_lines = [need.qualified(qualifiers=True) for need in ordered]
+                out_lines.extend([need.qualified(qualifiers=False) for need in ordered])
                 with open(requirements_filename, 'a') as req_file:
-                    for need in sorted(unique_list(list(needed))):
-                        out_line = need.qualified(qualifiers=True)
-                        if out_line:
-                            req_file.write(out_line + "\n")
-                    for need in sorted(unique_list(list(needed))):
-                        out_line = need.qualified(qualifiers=False)
-                        if out_line:
-                            req_file.write(out_line + "\n")
+                    req_file.write(header + ''.join(out_line + "\n" for out_line in out_lines if out_line))
             except IOError as ex:
                 warning("Can not add the following to the {filename} file: {needed}\n{err}".format(
                     filename=filename, needed=repr(needed), err=str(ex)))
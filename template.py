@@ -17,9 +17,11 @@ Templates have the extension '.template'.
 
 """
 
+import functools
 import os
 from pprint import pformat
 import shutil
+import stat
 import tempfile
 import traceback
 from herringlib.backup import next_backup_filename
@@ -29,6 +31,76 @@ from herringlib.simple_logger import error, info
 from herringlib.split_all import split_all
 
 
+@functools.lru_cache(maxsize=None)
+def _read_template(path, mtime):
+    """
+    Read a template file.  The contents are cached by (path, mtime) as the same template is rendered repeatedly
+    when generating a project.
+
+    :param path: the template file
+    :type path: str
+    :param mtime: the template file's modification time in nanoseconds
+    :type mtime: int
+    :return: the template contents
+    :rtype: str
+    """
+    with open(path) as in_file:
+        return in_file.read()
+
+
+def _scan_walk(path):
+    """
+    Recursively yield each directory under the given directory with the directory entries of its files.
+    Like os.walk, symbolic links to directories are not followed.  Only symbolic links need a stat call
+    to classify, the other entries use the type returned by scandir.
+
+    :param path: directory to scan
+    :type path: str
+    :return: generator of (directory path, file entries) tuples
+    :rtype: collections.Iterable[(str, list[os.DirEntry])]
+    """
+    try:
+        entries = list(os.scandir(path))
+    except OSError:
+        return
+    files = []
+    sub_dirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            sub_dirs.append(entry.path)
+        elif not (entry.is_symlink() and entry.is_dir()):
+            files.append(entry)
+    yield path, files
+    for sub_dir in sub_dirs:
+        for item in _scan_walk(sub_dir):
+            yield item
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_path(original_path, package_name):
+    """
+    Remove '.template' from the template parts of original_path and replace 'package' in them with package_name.
+    Cached as sibling template files share their directory paths.
+
+    :param original_path:  Path to a template file or directory.
+    :type original_path: str
+    :param package_name: The project's package name.
+    :type package_name: str
+    :return:  resolved path
+    :rtype: str
+    """
+    if '.template' not in original_path:
+        # nothing to resolve
+        return original_path
+    new_parts = []
+    for part in split_all(original_path):
+        if part.endswith('.template'):
+            part = part.replace('.template', '')
+            part = part.replace('package', package_name)
+        new_parts.append(part)
+    return os.path.join(*new_parts)
+
+
 class Template(object):
     """
     Handle templates.
@@ -46,13 +118,13 @@ class Template(object):
         :param overwrite: overwrite existing rendered files
         :type overwrite: bool
         """
-        for root_dir, dirs, files in os.walk(template_dir):
-            for file_name in files:
-                template_filename = os.path.join(root_dir, file_name)
-                # info('template_filename: %s' % template_filename)
-                dest_filename = self.resolve_template_dir(str(template_filename.replace(template_dir, '.')),
-                                                          defaults['package'])
-                self._render(template_filename, template_dir, dest_filename, defaults, overwrite=overwrite)
+        package_name = defaults['package']
+        for root_dir, entries in _scan_walk(template_dir):
+            # the directory part is resolved once for all of the files in the directory
+            dest_dir = _resolve_path(str(root_dir.replace(template_dir, '.')), package_name)
+            for entry in entries:
+                dest_filename = os.path.join(dest_dir, _resolve_path(entry.name, package_name))
+                self._render(entry, template_dir, dest_filename, defaults, overwrite=overwrite)
 
     # noinspection PyMethodMayBeStatic
     def resolve_template_dir(self, original_path, package_name):
@@ -66,13 +138,7 @@ class Template(object):
         :return:  resolved path
         :rtype: str
         """
-        new_parts = []
-        for part in split_all(original_path):
-            if part.endswith('.template'):
-                part = part.replace('.template', '')
-                part = part.replace('package', package_name)
-            new_parts.append(part)
-        return os.path.join(*new_parts)
+        return _resolve_path(original_path, package_name)
 
     # noinspection PyMethodMayBeStatic
     def _create_from_template(self, src_filename, dest_filename, **kwargs):
@@ -92,8 +158,7 @@ class Template(object):
         :param dest_filename: the rendered file
         """
         info("creating {dest} from {src}".format(dest=dest_filename, src=src_filename))
-        with open(src_filename) as in_file:
-            template = in_file.read()
+        template = _read_template(src_filename, os.stat(src_filename).st_mtime_ns)
 
         new_filename = None
         try:
@@ -102,14 +167,9 @@ class Template(object):
             new_filename = tf.name
             tf.close()
 
-            rendered = template.format(**kwargs)
+            rendered = template.format_map(kwargs)
             with open(new_filename, 'w') as out_file:
-                try:
-                    out_file.write(rendered)
-                # catching all exceptions
-                # pylint: disable=W0703
-                except Exception as ex:
-                    error(ex)
+                out_file.write(rendered)
 
             # if there is a dest_filename, then handle backing it up
             if os.path.isfile(dest_filename):
@@ -145,21 +205,28 @@ class Template(object):
                 if os.path.isfile(new_filename):
                     os.remove(new_filename)
 
-    def _render(self, template_filename, template_dir, dest_filename, defaults, overwrite=False):
+    def _render(self, template_entry, template_dir, dest_filename, defaults, overwrite=False):
         # info('dest_filename: %s' % dest_filename)
-        if os.path.isdir(template_filename):
+        template_filename = template_entry.path
+        if template_entry.is_dir():
             mkdir_p(template_filename)
         else:
             mkdir_p(os.path.dirname(dest_filename))
-            template_root, template_ext = os.path.splitext(template_filename)
-            if template_ext == '.template':
-                if not os.path.isdir(dest_filename):
-                    if overwrite or not os.path.isfile(dest_filename) or os.path.getsize(dest_filename) == 0:
+            # one stat of the destination answers the isdir, isfile, and size questions
+            try:
+                dest_stat = os.stat(dest_filename)
+            except OSError:
+                dest_stat = None
+            dest_is_dir = dest_stat is not None and stat.S_ISDIR(dest_stat.st_mode)
+            dest_is_file = dest_stat is not None and stat.S_ISREG(dest_stat.st_mode)
+            if template_filename.endswith('.template'):
+                if not dest_is_dir:
+                    if overwrite or not dest_is_file or dest_stat.st_size == 0:
                         self._create_from_template(template_filename, dest_filename, **defaults)
             else:
-                if overwrite or not os.path.isfile(dest_filename):
+                if overwrite or not dest_is_file:
                     if os.path.join(template_dir, '__init__.py') != template_filename and os.path.join(
                             template_dir, 'bin', '__init__.py') != template_filename:
                         shutil.copyfile(template_filename, dest_filename)
-            if os.path.exists(template_filename) and os.path.exists(dest_filename):
+            if os.path.exists(dest_filename):
                 shutil.copymode(template_filename, dest_filename)
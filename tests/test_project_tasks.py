@@ -0,0 +1,105 @@
+# coding=utf-8
+
+"""
+Tests the herring config file reader used by the project tasks against ConfigParser.
+"""
+
+from configparser import ConfigParser, InterpolationMissingOptionError
+
+import pytest
+
+# noinspection PyProtectedMember
+from herringlib.project_tasks import _read_config_files
+
+
+def _config_parser_sections(config_files):
+    config = ConfigParser()
+    config.read(config_files)
+    return dict((section, dict(config.items(section))) for section in config.sections())
+
+
+def _write(path, text):
+    path.write_text(text)
+    return str(path)
+
+
+def test_read_config_files_sections(tmp_path):
+    """Keys are lower cased and comment lines are skipped"""
+    config_file = _write(tmp_path / 'herring.conf', '[project]\n'
+                                                    '# comment\n'
+                                                    '; another comment\n'
+                                                    'Name = Foo\n'
+                                                    'author: Me\n'
+                                                    '\n'
+                                                    '[other]\n'
+                                                    'name = Bar\n')
+    sections = _read_config_files([config_file])
+    assert sections == {'project': {'name': 'Foo', 'author': 'Me'}, 'other': {'name': 'Bar'}}
+    assert sections == _config_parser_sections([config_file])
+
+
+def test_read_config_files_continuation_lines(tmp_path):
+    """Indented lines continue the previous value"""
+    config_file = _write(tmp_path / 'herring.conf', '[project]\n'
+                                                    'description = first line\n'
+                                                    '    second line\n'
+                                                    '\tthird line\n'
+                                                    'name = Foo\n')
+    sections = _read_config_files([config_file])
+    assert sections['project']['description'] == 'first line\nsecond line\nthird line'
+    assert sections == _config_parser_sections([config_file])
+
+
+def test_read_config_files_default_section(tmp_path):
+    """[DEFAULT] keys are merged into every section without overriding the section's own keys"""
+    config_file = _write(tmp_path / 'herring.conf', '[DEFAULT]\n'
+                                                    'author = Me\n'
+                                                    'name = Default\n'
+                                                    '\n'
+                                                    '[project]\n'
+                                                    'name = Foo\n'
+                                                    '\n'
+                                                    '[other]\n')
+    sections = _read_config_files([config_file])
+    assert sections == {'project': {'author': 'Me', 'name': 'Foo'}, 'other': {'author': 'Me', 'name': 'Default'}}
+    assert sections == _config_parser_sections([config_file])
+
+
+def test_read_config_files_interpolation(tmp_path):
+    """'%(name)s' is replaced by the named key, including [DEFAULT] and nested references, and '%%' by '%'"""
+    config_file = _write(tmp_path / 'herring.conf', '[DEFAULT]\n'
+                                                    'base = /opt/%(Name)s\n'
+                                                    '\n'
+                                                    '[project]\n'
+                                                    'name = Foo\n'
+                                                    'dir = %(base)s/src\n'
+                                                    'coverage = 100%%\n')
+    sections = _read_config_files([config_file])
+    assert sections['project'] == {'base': '/opt/Foo', 'name': 'Foo', 'dir': '/opt/Foo/src', 'coverage': '100%'}
+    assert sections == _config_parser_sections([config_file])
+
+
+def test_read_config_files_unknown_interpolation_key(tmp_path):
+    """Unlike ConfigParser, which raises an error, a reference to a missing key is left as is"""
+    config_file = _write(tmp_path / 'herring.conf', '[project]\n'
+                                                    'dir = %(missing)s/src\n')
+    assert _read_config_files([config_file]) == {'project': {'dir': '%(missing)s/src'}}
+    with pytest.raises(InterpolationMissingOptionError):
+        _config_parser_sections([config_file])
+
+
+def test_read_config_files_missing_and_unreadable_files(tmp_path):
+    """Missing and unreadable files are ignored and later files override earlier ones"""
+    first = _write(tmp_path / 'first.conf', '[project]\n'
+                                            'name = Foo\n'
+                                            'author = Me\n')
+    second = _write(tmp_path / 'second.conf', '[project]\n'
+                                              'name = Bar\n')
+    missing = str(tmp_path / 'missing.conf')
+    # a directory can not be read as a config file
+    unreadable = str(tmp_path)
+    config_files = [missing, first, unreadable, second]
+    sections = _read_config_files(config_files)
+    assert sections == {'project': {'name': 'Bar', 'author': 'Me'}}
+    assert sections == _config_parser_sections(config_files)
+    assert _read_config_files([missing, unreadable]) == {}
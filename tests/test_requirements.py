@@ -1,10 +1,13 @@
 # coding=utf-8
 
+import os
 import sys
 
 from pathlib import Path
 
-from herringlib.requirements import Requirements, Requirement
+import pytest
+
+from herringlib.requirements import DocstringCache, Requirements, Requirement
 from herringlib.list_helper import compress_list, is_sequence, unique_list
 
 
@@ -93,8 +96,77 @@ def test_supported_python():
     assert not Requirement('foo; python_version == "99.99"').supported_python()
 
 
+def test_supported_python_operators(monkeypatch):
+    monkeypatch.setattr(sys, 'version', '3.8')
+    expected = {
+        '==': (False, True, False),
+        '!=': (True, False, True),
+        '<': (False, False, True),
+        '<=': (False, True, True),
+        '>': (True, False, False),
+        '>=': (True, True, False),
+    }
+    for operator, results in expected.items():
+        for version, result in zip(('2.7', '3.8', '3.9'), results):
+            requirement = Requirement('foo; python_version {op} "{ver}"'.format(op=operator, ver=version))
+            assert requirement.supported_python() is result, requirement
+    assert Requirement('foo; python_version in "3.8"').supported_python()
+    assert not Requirement('foo; python_version not in "3.8"').supported_python()
+    with pytest.raises(ValueError):
+        Requirement('foo; python_version =< "3.8"').supported_python()
+
+
+def test_merge():
+    # the versions of markers with the same name and operator are combined, sorted, and deduplicated
+    requirement = Requirement('foo; python_version in "3.8 2.7"')
+    requirement.merge(Requirement('foo; python_version in "3.4 2.7"'))
+    assert str(requirement) == "foo; python_version in '2.7 3.4 3.8'"
+    assert [marker.marker for marker in requirement.markers] == ['python_version in 2.7 3.4 3.8']
+    assert requirement == Requirement("foo; python_version in '2.7 3.4 3.8'")
+
+    # markers with different operators are kept apart
+    requirement = Requirement('foo; python_version < "3.0"')
+    requirement.merge(Requirement('foo; python_version in "3.8"'))
+    assert str(requirement) == "foo; python_version < '3.0'; python_version in '3.8'"
+
+    requirement = Requirement('foo')
+    requirement.merge(Requirement('foo; python_version == "2.7"'))
+    assert str(requirement) == "foo; python_version == '2.7'"
+
+
 def test_sorting():
     requirements = [Requirement("foo"), Requirement("bar")]
     sorted_requirements = [Requirement("bar"), Requirement("foo")]
     assert sorted(requirements) == sorted_requirements
     assert sorted(compress_list(unique_list(requirements))) == sorted_requirements
+
+
+def test_docstring_cache(tmp_path):
+    cache_file = str(tmp_path / 'cache' / 'docstrings.jsonl')
+    module = tmp_path / 'module.py'
+    module.write_text('"""doc"""\n')
+    stat = os.stat(str(module))
+
+    cache = DocstringCache(cache_file)
+    assert cache.get(str(module), stat) is None
+    cache.put(str(module), stat, 'doc')
+    cache.put(str(module), stat, 'new doc')
+    assert cache.get(str(module), stat) == 'new doc'
+    cache.close()
+
+    # the latest entry for a path wins when the cache file is loaded
+    cache = DocstringCache(cache_file)
+    assert cache.get(str(module), stat) == 'new doc'
+
+    module.write_text('"""changed"""\n')
+    assert cache.get(str(module), os.stat(str(module))) is None
+
+
+# noinspection PyProtectedMember
+def test_leading_docstring():
+    from io import BytesIO
+    from herringlib.requirements import _leading_docstring
+
+    assert _leading_docstring(BytesIO(b'# coding=utf-8\n\n"""\n    doc\n    more\n"""\nimport os\n').readline) == 'doc\nmore'
+    assert _leading_docstring(BytesIO(b'import os\n"""not a docstring"""\n').readline) == ''
+    assert _leading_docstring(BytesIO(b'"""not a docstring""" + x\n').readline) == ''